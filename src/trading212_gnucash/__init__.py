@@ -18,7 +18,8 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-__version__ = "2.0.0"
+from ._version import __version__
+
 __author__ = "Tim Waugh"
 __email__ = "twaugh@redhat.com"
 
@@ -0,0 +1,3 @@
+"""Package version, kept importable without the rest of the package."""
+
+__version__ = "2.0.0"
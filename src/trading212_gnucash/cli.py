@@ -18,24 +18,31 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import logging
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
 import click
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from . import __version__
-from .config import Config, create_sample_config
+from ._version import __version__
+from .config import Config, create_sample_config, set_cache_enabled
 from .converter import Trading212Converter
 
 console = Console()
 
+# Keep package loggers quiet until a command that actually logs calls
+# setup_logging; commands that only print to the console never pay for
+# handler construction.
+logging.getLogger("trading212_gnucash").addHandler(logging.NullHandler())
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Set up rich logging."""
+    # Imported here so commands that never log (e.g. --version/--help)
+    # don't pay for pulling in rich.logging at startup
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
 
     logging.basicConfig(
@@ -48,13 +55,19 @@ def setup_logging(verbose: bool = False) -> None:
 
 @click.group(invoke_without_command=True)
 @click.option("--version", is_flag=True, help="Show version and exit")
+@click.option(
+    "--no-cache", is_flag=True, help="Do not use the on-disk configuration cache"
+)
 @click.pass_context
-def cli(ctx: click.Context, version: bool) -> None:
+def cli(ctx: click.Context, version: bool, no_cache: bool) -> None:
     """Trading 212 to GnuCash converter.
 
     A modern Python tool to convert Trading 212 CSV exports into a format
     suitable for GnuCash multi-split import.
     """
+    if no_cache:
+        set_cache_enabled(False)
+
     if version:
         click.echo(f"trading212-gnucash {__version__}")
         ctx.exit()
@@ -88,6 +101,8 @@ def convert(
     INPUT_FILE: Path to the Trading 212 CSV export file
     OUTPUT_FILE: Path for the GnuCash-compatible CSV output
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
 
@@ -95,7 +110,7 @@ def convert(
         # Load configuration
         if config:
             app_config = Config.load_from_file(config)
-            logger.info(f"Loaded configuration from {config}")
+            logger.info("Loaded configuration from %s", config)
         else:
             app_config = Config.load_from_file()
             logger.info("Using default configuration")
@@ -146,7 +161,7 @@ def convert(
                 sys.exit(1)
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         if verbose:
             console.print_exception()
         sys.exit(1)
@@ -167,8 +182,6 @@ def init_config(config: Path, force: bool) -> None:
     This creates a YAML configuration file with default settings that you can
     customize for your needs.
     """
-    setup_logging()
-
     if config.exists() and not force:
         console.print(f"[yellow]Configuration file already exists: {config}[/yellow]")
         console.print("Use --force to overwrite")
@@ -207,7 +220,7 @@ def validate_config(config: Optional[Path]) -> None:
 
     Check that the configuration file is valid and display current settings.
     """
-    setup_logging()
+    from rich.table import Table
 
     try:
         if config:
@@ -222,14 +235,17 @@ def validate_config(config: Optional[Path]) -> None:
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="green")
 
-        table.add_row("Ticker Mappings", str(len(app_config.ticker_map)))
-        table.add_row("Deposit Account", app_config.deposit_account)
-        table.add_row("Interest Account", app_config.interest_account)
-        table.add_row(
-            "Conversion Fee Account", app_config.expense_accounts.conversion_fee
-        )
-        table.add_row("French Tax Account", app_config.expense_accounts.french_tax)
-        table.add_row("Stamp Duty Account", app_config.expense_accounts.stamp_duty_tax)
+        expense = app_config.expense_accounts
+        rows = [
+            ("Ticker Mappings", str(len(app_config.ticker_map))),
+            ("Deposit Account", app_config.deposit_account),
+            ("Interest Account", app_config.interest_account),
+            ("Conversion Fee Account", expense.conversion_fee),
+            ("French Tax Account", expense.french_tax),
+            ("Stamp Duty Account", expense.stamp_duty_tax),
+        ]
+        for setting, value in rows:
+            table.add_row(setting, value)
 
         console.print(table)
 
@@ -248,6 +264,73 @@ def validate_config(config: Optional[Path]) -> None:
         sys.exit(1)
 
 
+# Files below this size are summarized with the plain Python pass even when
+# polars is installed; the vectorized path only pays off on large exports.
+_POLARS_THRESHOLD = 1 << 20  # 1 MiB
+
+
+def _summarize_with_polars(
+    input_file: Path,
+) -> Optional[
+    tuple[
+        int,
+        Optional[str],
+        Optional[str],
+        int,
+        "list[tuple[str, int]]",
+        "list[tuple[str, int]]",
+    ]
+]:
+    """Summarize a large CSV with polars, if available.
+
+    Returns (total, min_time, max_time, unique_tickers, action_rows,
+    ticker_rows) or None when polars is not installed, the file is small
+    enough for the Python pass, or the vectorized summary fails for any
+    reason (in which case the caller falls back to the row-by-row path).
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+
+    try:
+        if input_file.stat().st_size < _POLARS_THRESHOLD:
+            return None
+
+        lf = pl.scan_csv(input_file, infer_schema_length=0)
+        summary = lf.select(
+            pl.len().alias("total"),
+            pl.col("Time").min().alias("min_time"),
+            pl.col("Time").max().alias("max_time"),
+            pl.col("Ticker").drop_nulls().n_unique().alias("unique_tickers"),
+        ).collect()
+        actions = (
+            lf.group_by("Action")
+            .agg(pl.len().alias("count"))
+            .sort("count", descending=True)
+            .collect()
+        )
+        tickers = (
+            lf.drop_nulls("Ticker")
+            .group_by("Ticker")
+            .agg(pl.len().alias("count"))
+            .sort("count", descending=True)
+            .head(10)
+            .collect()
+        )
+    except Exception:
+        return None
+
+    return (
+        int(summary["total"][0]),
+        summary["min_time"][0],
+        summary["max_time"][0],
+        int(summary["unique_tickers"][0]),
+        list(actions.iter_rows()),
+        list(tickers.iter_rows()),
+    )
+
+
 @cli.command()
 @click.argument("input_file", type=click.Path(exists=True, path_type=Path))
 def info(input_file: Path) -> None:
@@ -255,6 +338,8 @@ def info(input_file: Path) -> None:
 
     INPUT_FILE: Path to the Trading 212 CSV export file
     """
+    from rich.table import Table
+
     setup_logging()
 
     try:
@@ -267,63 +352,77 @@ def info(input_file: Path) -> None:
         # Analyze the file
         console.print(f"[blue]Analyzing:[/blue] {input_file}")
 
-        transactions = list(converter.read_transactions(input_file))
+        # For large exports, summarize with polars when it is installed;
+        # otherwise accumulate statistics in a single streaming pass so the
+        # full transaction list is never materialized
+        fast_summary = _summarize_with_polars(input_file)
+
+        if fast_summary is not None:
+            (
+                total,
+                min_time,
+                max_time,
+                unique_tickers,
+                action_rows,
+                ticker_rows,
+            ) = fast_summary
+        else:
+            total = 0
+            action_counts: Counter[str] = Counter()
+            ticker_counts: Counter[str] = Counter()
+            min_time = None
+            max_time = None
 
-        if not transactions:
-            console.print("[yellow]No transactions found[/yellow]")
-            return
+            for transaction in converter.read_transactions(input_file):
+                total += 1
+                action_counts[transaction.action] += 1
 
-        # Summary statistics
-        action_counts: dict[str, int] = {}
-        ticker_counts: dict[str, int] = {}
-        date_range = []
+                if transaction.ticker:
+                    ticker_counts[transaction.ticker] += 1
 
-        for transaction in transactions:
-            action_counts[transaction.action] = (
-                action_counts.get(transaction.action, 0) + 1
-            )
+                if min_time is None or transaction.time < min_time:
+                    min_time = transaction.time
+                if max_time is None or transaction.time > max_time:
+                    max_time = transaction.time
 
-            if transaction.ticker:
-                ticker_counts[transaction.ticker] = (
-                    ticker_counts.get(transaction.ticker, 0) + 1
-                )
+            unique_tickers = len(ticker_counts)
+            action_rows = action_counts.most_common()
+            ticker_rows = ticker_counts.most_common(10)
 
-            date_range.append(transaction.time)
+        if total == 0:
+            console.print("[yellow]No transactions found[/yellow]")
+            return
 
         # Display summary
         summary_table = Table(title="File Summary")
         summary_table.add_column("Metric", style="cyan")
         summary_table.add_column("Value", style="green")
 
-        summary_table.add_row("Total Transactions", str(len(transactions)))
-        summary_table.add_row("Unique Tickers", str(len(ticker_counts)))
-        if date_range:
-            summary_table.add_row(
-                "Date Range", f"{min(date_range)} to {max(date_range)}"
-            )
+        summary_table.add_row("Total Transactions", str(total))
+        summary_table.add_row("Unique Tickers", str(unique_tickers))
+        if min_time is not None:
+            summary_table.add_row("Date Range", f"{min_time} to {max_time}")
 
         console.print(summary_table)
 
         # Action types
-        if action_counts:
+        if action_rows:
             action_table = Table(title="Transaction Types")
             action_table.add_column("Action", style="yellow")
             action_table.add_column("Count", style="green")
 
-            for action, count in sorted(action_counts.items()):
+            for action, count in action_rows:
                 action_table.add_row(action, str(count))
 
             console.print(action_table)
 
         # Top tickers
-        if ticker_counts:
+        if ticker_rows:
             ticker_table = Table(title="Top Tickers")
             ticker_table.add_column("Ticker", style="yellow")
             ticker_table.add_column("Transactions", style="green")
 
-            for ticker, count in sorted(
-                ticker_counts.items(), key=lambda x: x[1], reverse=True
-            )[:10]:
+            for ticker, count in ticker_rows:
                 ticker_table.add_row(ticker, str(count))
 
             console.print(ticker_table)
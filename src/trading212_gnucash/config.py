@@ -16,17 +16,160 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import contextlib
+import copy
+import functools
+import json
 import os
+import tempfile
 from pathlib import Path
-from typing import Any, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
 
-import yaml
-from pydantic import BaseModel, Field
+@functools.lru_cache(maxsize=1)
+def _yaml() -> "tuple[Any, Any, Any]":
+    """Import PyYAML on first use, returning (module, Loader, Dumper).
+
+    The cache-hit path in load_from_file never touches YAML, so deferring
+    the import keeps libyaml binding off the common startup path. Prefer
+    the libyaml-backed C loader/dumper when PyYAML was built with it; it
+    parses several times faster than the pure-Python implementation.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # pragma: no cover - depends on how PyYAML was built
+        from yaml import SafeDumper as Dumper
+        from yaml import SafeLoader as Loader
+
+    return yaml, Loader, Dumper
+
+
+# orjson reads and writes the JSON cache considerably faster than the
+# stdlib json module; fall back to json when it is not installed.
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(text: str) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(data: dict[str, Any]) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> "dict[str, Any]":
+    """Parse a YAML config file, memoized on its stat signature.
+
+    The (mtime_ns, size) key invalidates the entry whenever the file
+    changes, so repeated loads of an unchanged file skip parsing
+    entirely. Callers must deep-copy the result before mutating it; tests
+    that rewrite a file without advancing its mtime can call
+    _parse_yaml_cached.cache_clear().
+    """
+    yaml, loader, _ = _yaml()
+    # Hand bytes straight to the loader: one read(2) sized to the file, and
+    # UTF-8 decoding happens inside the (lib)yaml scanner instead of going
+    # through Python's incremental text decoder first
+    return yaml.load(Path(path).read_bytes(), Loader=loader) or {}
+
+
+# Module-level switch for the config caches (in-memory and on-disk); the
+# CLI can disable them with --no-cache.
+_cache_enabled = True
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the on-disk configuration cache."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def _read_cache(cache_path: Path, cache_key: str) -> Optional[dict[str, Any]]:
+    """Read cached config data if it matches the expected key."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            if f.readline().strip() != cache_key:
+                return None
+            data = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+def _write_cache(cache_path: Path, cache_key: str, data: dict[str, Any]) -> None:
+    """Atomically write the parsed config data to the cache file."""
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(cache_path.parent), prefix=cache_path.name
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(cache_key + "\n")
+            f.write(_json_dumps(data))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Caching is best-effort; the YAML file remains authoritative
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+# Environment variables recognized by Config.load_from_env, mapped to the
+# config fields they populate
+_ENV_TICKER_PREFIX = "TRADING212_TICKER_"
+_ENV_ACCOUNT_FIELDS = {
+    "TRADING212_DEPOSIT_ACCOUNT": "deposit_account",
+    "TRADING212_INTEREST_ACCOUNT": "interest_account",
+}
+_ENV_EXPENSE_FIELDS = {
+    "TRADING212_CONVERSION_FEE_ACCOUNT": "conversion_fee",
+    "TRADING212_FRENCH_TAX_ACCOUNT": "french_tax",
+    "TRADING212_STAMP_DUTY_ACCOUNT": "stamp_duty_tax",
+}
+
+# Default ticker mappings; a read-only view so the table itself can never
+# be mutated, with instances copying it on construction
+_DEFAULT_TICKER_MAP = MappingProxyType(
+    {
+        "ACME": "ACME.L",
+        "VOD": "VOD.L",
+        "MSFT": "MSFT",
+        "AAPL": "AAPL",
+        "GOOGL": "GOOGL",
+    }
+)
+
+# Default config file locations, in order of preference; expanded once at
+# import so load_from_file doesn't redo ~ expansion on every call
+_DEFAULT_CONFIG_CANDIDATES = (
+    Path("~/.config/trading212-gnucash/config.yaml").expanduser(),
+    Path("~/.config/trading212-gnucash/config.yml").expanduser(),
+    Path("trading212_config.yaml"),  # Current directory fallback
+    Path("trading212_config.yml"),  # Current directory fallback
+    Path("~/.trading212_config.yaml").expanduser(),  # Legacy location
+)
 
 
 class ExpenseAccounts(BaseModel):
     """Configuration for expense accounts."""
 
+    model_config = ConfigDict(frozen=True)
+
     conversion_fee: str = Field(
         default="Expenses:Currency Conversion Fees",
         description="Account for currency conversion fees",
@@ -42,21 +185,24 @@ class ExpenseAccounts(BaseModel):
 
 
 class Config(BaseModel):
-    """Main configuration model."""
+    """Main configuration model.
+
+    Frozen so instances can be shared safely (e.g. the default-config
+    singleton) and hashed; build variants with model_copy(update=...)
+    rather than assigning to fields.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     ticker_map: dict[str, str] = Field(
-        default_factory=lambda: {
-            "ACME": "ACME.L",
-            "VOD": "VOD.L",
-            "MSFT": "MSFT",
-            "AAPL": "AAPL",
-            "GOOGL": "GOOGL",
-        },
+        default_factory=lambda: dict(_DEFAULT_TICKER_MAP),
         description="Map Trading 212 ticker symbols to GnuCash stock symbols",
     )
 
     expense_accounts: ExpenseAccounts = Field(
-        default_factory=ExpenseAccounts,
+        # A single frozen instance shared by every default Config, rather
+        # than a fresh sub-model per construction
+        default=ExpenseAccounts(),
         description="Configuration for expense accounts",
     )
 
@@ -70,83 +216,109 @@ class Config(BaseModel):
         description="Account for interest on cash from Trading 212",
     )
 
+    @classmethod
+    def _from_trusted_dict(cls, data: "dict[str, Any]") -> "Config":
+        """Build a Config from already-validated data, skipping validation.
+
+        Only for data this package serialized itself (the JSON cache holds
+        a model_dump of a validated Config); untrusted YAML always goes
+        through the full validator chain.
+        """
+        kwargs = dict(data)
+        expense = kwargs.pop("expense_accounts", None)
+        if isinstance(expense, dict):
+            kwargs["expense_accounts"] = ExpenseAccounts.model_construct(**expense)
+        return cls.model_construct(**kwargs)
+
     @classmethod
     def load_from_file(cls, config_path: Optional[Union[str, Path]] = None) -> "Config":
         """Load configuration from file with fallback to defaults."""
         if config_path is None:
-            # Try common config file locations in order of preference
-            possible_paths = [
-                Path("~/.config/trading212-gnucash/config.yaml").expanduser(),
-                Path("~/.config/trading212-gnucash/config.yml").expanduser(),
-                Path("trading212_config.yaml"),  # Current directory fallback
-                Path("trading212_config.yml"),  # Current directory fallback
-                Path("~/.trading212_config.yaml").expanduser(),  # Legacy location
-            ]
-
-            for path in possible_paths:
-                if path.exists():
-                    config_path = path
-                    break
+            config_path = next(
+                (p for p in _DEFAULT_CONFIG_CANDIDATES if p.exists()), None
+            )
 
         if config_path is None:
-            return cls()  # Use defaults
+            return _default_config()  # Use defaults
 
-        config_path = Path(config_path)
-
-        if not config_path.exists():
-            return cls()  # Use defaults
+        if not isinstance(config_path, Path):
+            config_path = Path(config_path)
 
+        # One stat serves both the existence check and the cache key (EAFP
+        # instead of a separate exists() call)
         try:
-            with open(config_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            st = config_path.stat()
+        except OSError:
+            return _default_config()  # Use defaults
+
+        # YAML parsing dominates startup time, so the parsed config is cached
+        # as JSON alongside the config file and reused while it is current.
+        cache_path = config_path.with_name(config_path.name + ".cache.json")
+        cache_key = f"{st.st_mtime_ns}:{st.st_size}"
+        if _cache_enabled:
+            data = _read_cache(cache_path, cache_key)
+            if data is not None:
+                try:
+                    return cls._from_trusted_dict(data)
+                except (TypeError, ValueError):
+                    # Stale or corrupt cache; fall back to the YAML path
+                    with contextlib.suppress(OSError):
+                        cache_path.unlink(missing_ok=True)
+
+        yaml, loader, _ = _yaml()
+        try:
+            if _cache_enabled:
+                # Deep copy so validation or later edits cannot mutate the
+                # memoized dict
+                data = copy.deepcopy(
+                    _parse_yaml_cached(str(config_path), st.st_mtime_ns, st.st_size)
+                )
+            else:
+                data = yaml.load(config_path.read_bytes(), Loader=loader) or {}
+
+            config = cls(**data)
 
-            if data is None:
-                return cls()
+            if _cache_enabled:
+                # Cache the validated dump, not the raw YAML dict, so the
+                # trusted-construct path above sees coerced values
+                _write_cache(cache_path, cache_key, config.model_dump())
 
-            return cls(**data)
+            return config
 
         except (yaml.YAMLError, ValueError) as e:
+            if _cache_enabled:
+                with contextlib.suppress(OSError):
+                    cache_path.unlink(missing_ok=True)
             raise ValueError(f"Error loading config file {config_path}: {e}") from e
 
     @classmethod
     def load_from_env(cls) -> "Config":
         """Load configuration from environment variables."""
         config_data: dict[str, Any] = {}
+        ticker_map: dict[str, str] = {}
+        expense_accounts: dict[str, str] = {}
 
-        # Load ticker mappings from environment
-        ticker_map = {}
+        # Single pass over the environment, dispatching each variable by
+        # prefix (ticker mappings) or exact name (account settings)
         for key, value in os.environ.items():
-            if key.startswith("TRADING212_TICKER_"):
-                ticker = key.replace("TRADING212_TICKER_", "")
-                ticker_map[ticker] = value
+            if key.startswith(_ENV_TICKER_PREFIX):
+                ticker_map[key[len(_ENV_TICKER_PREFIX) :]] = value
+            elif key in _ENV_ACCOUNT_FIELDS:
+                if value:
+                    config_data[_ENV_ACCOUNT_FIELDS[key]] = value
+            elif key in _ENV_EXPENSE_FIELDS:
+                if value:
+                    expense_accounts[_ENV_EXPENSE_FIELDS[key]] = value
 
         if ticker_map:
             config_data["ticker_map"] = ticker_map
 
-        # Load account configurations
-        deposit_account = os.getenv("TRADING212_DEPOSIT_ACCOUNT")
-        if deposit_account:
-            config_data["deposit_account"] = deposit_account
-
-        interest_account = os.getenv("TRADING212_INTEREST_ACCOUNT")
-        if interest_account:
-            config_data["interest_account"] = interest_account
-
-        # Load expense accounts
-        expense_accounts: dict[str, str] = {}
-        conversion_fee_account = os.getenv("TRADING212_CONVERSION_FEE_ACCOUNT")
-        if conversion_fee_account:
-            expense_accounts["conversion_fee"] = conversion_fee_account
-        french_tax_account = os.getenv("TRADING212_FRENCH_TAX_ACCOUNT")
-        if french_tax_account:
-            expense_accounts["french_tax"] = french_tax_account
-        stamp_duty_account = os.getenv("TRADING212_STAMP_DUTY_ACCOUNT")
-        if stamp_duty_account:
-            expense_accounts["stamp_duty_tax"] = stamp_duty_account
-
         if expense_accounts:
             config_data["expense_accounts"] = ExpenseAccounts(**expense_accounts)
 
+        if not config_data:
+            return _default_config()
+
         return cls(**config_data)
 
     def save_to_file(self, config_path: Union[str, Path]) -> None:
@@ -155,59 +327,88 @@ class Config(BaseModel):
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Convert to dict for YAML serialization
-        data = self.dict()
+        data = self.model_dump()
 
+        yaml, _, dumper = _yaml()
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+    @functools.cached_property
+    def _ticker_lookup(self) -> Callable[[str], str]:
+        """Ticker lookup closure, binding the map's get method once."""
+        get = self.ticker_map.get
+        return lambda ticker: get(ticker, ticker)
 
     def get_gnucash_ticker(self, trading212_ticker: str) -> str:
         """Get GnuCash stock symbol for Trading 212 ticker, with fallback."""
-        return self.ticker_map.get(trading212_ticker, trading212_ticker)
-
-    # Deprecated alias for backward compatibility
-    def get_yahoo_ticker(self, trading212_ticker: str) -> str:
-        """Deprecated: Use get_gnucash_ticker instead."""
-        return self.get_gnucash_ticker(trading212_ticker)
+        return self._ticker_lookup(trading212_ticker)
+
+    # Deprecated alias for backward compatibility; bound to the same
+    # function object so the alias adds no extra call frame
+    get_yahoo_ticker = get_gnucash_ticker
+
+    @functools.cached_property
+    def _tax_accounts(self) -> dict[str, str]:
+        """Tax type to account lookup, built once per instance."""
+        return {
+            "french": self.expense_accounts.french_tax,
+            "stamp_duty": self.expense_accounts.stamp_duty_tax,
+        }
 
     def get_tax_account(self, tax_type: str) -> str:
         """Get the appropriate tax account based on tax type."""
-        if tax_type == "french":
-            return self.expense_accounts.french_tax
-        elif tax_type == "stamp_duty":
-            return self.expense_accounts.stamp_duty_tax
-        else:
-            # Default to French tax account for unknown types
-            return self.expense_accounts.french_tax
-
-
-def create_sample_config(config_path: Union[str, Path]) -> None:
-    """Create a sample configuration file."""
-    config_path = Path(config_path)
-
-    sample_config = Config()  # Use defaults
-
-    # Add some example ticker mappings
-    sample_config.ticker_map.update(
-        {
-            "TSLA": "TSLA",
-            "AMZN": "AMZN",
-            "NFLX": "NFLX",
-            "META": "META",
-            "NVDA": "NVDA",
-            "FAKE": "FAKE.L",  # Example made-up company
-        }
-    )
-
-    sample_config.save_to_file(config_path)
-
-    # Add comments to the generated file
-    with open(config_path, encoding="utf-8") as f:
-        content = f.read()
-
-    commented_content = f"""# Trading 212 to GnuCash Multi-Split Converter Configuration
+        # Default to French tax account for unknown types
+        return self._tax_accounts.get(tax_type, self.expense_accounts.french_tax)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config() -> Config:
+    """Shared default Config instance.
+
+    The model is frozen, so every no-override load path can hand out the
+    same object instead of re-running validation over the default ticker
+    map and expense accounts. Callers must not mutate its ticker_map.
+    """
+    return Config()
+
+
+# Example ticker mappings added on top of the defaults in the sample config
+_SAMPLE_TICKER_EXAMPLES = {
+    "TSLA": "TSLA",
+    "AMZN": "AMZN",
+    "NFLX": "NFLX",
+    "META": "META",
+    "NVDA": "NVDA",
+    "FAKE": "FAKE.L",  # Example made-up company
+}
+
+# The sample config pre-rendered as YAML: the Config defaults plus
+# _SAMPLE_TICKER_EXAMPLES, with the explanatory comments. A test checks it
+# still parses to the programmatically-built equivalent, so it cannot
+# silently drift from the defaults above.
+_SAMPLE_CONFIG_YAML = """\
+# Trading 212 to GnuCash Multi-Split Converter Configuration
 # Edit this file to customize your ticker symbols and account mappings
 
-{content}
+ticker_map:
+  ACME: ACME.L
+  VOD: VOD.L
+  MSFT: MSFT
+  AAPL: AAPL
+  GOOGL: GOOGL
+  TSLA: TSLA
+  AMZN: AMZN
+  NFLX: NFLX
+  META: META
+  NVDA: NVDA
+  FAKE: FAKE.L
+expense_accounts:
+  conversion_fee: Expenses:Currency Conversion Fees
+  french_tax: Expenses:French Transaction Tax
+  stamp_duty_tax: Expenses:Stamp Duty Reserve Tax
+deposit_account: Assets:Trading 212 Deposits
+interest_account: Income:Trading 212 Interest
+
 #
 # Configuration Notes:
 # - ticker_map: Maps Trading 212 symbols to GnuCash stock symbols (may include exchange suffixes)
@@ -218,5 +419,13 @@ def create_sample_config(config_path: Union[str, Path]) -> None:
 # The source account (bank/cash account) is configured during GnuCash import.
 """
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        f.write(commented_content)
+
+def create_sample_config(config_path: Union[str, Path]) -> None:
+    """Create a sample configuration file.
+
+    The content is static, so it is written verbatim from the pre-rendered
+    template with no model construction or YAML serialization.
+    """
+    config_path = Path(config_path)
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(_SAMPLE_CONFIG_YAML, encoding="utf-8")
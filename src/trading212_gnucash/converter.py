@@ -17,14 +17,59 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import csv
+import functools
 import logging
+import sys
 from collections.abc import Iterator
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Optional, Union, cast
 
 from .config import Config
-from .models import ConversionResult, GnuCashSplit, Trading212Transaction
+from .models import (
+    _ALIAS_MAP,
+    CASH_ACTIONS,
+    CashTransaction,
+    ConversionResult,
+    GnuCashSplit,
+    Trading212Transaction,
+)
+
+# One transaction per CSV row; trading rows get the full model, cash rows
+# the lightweight one
+Transaction = Union[Trading212Transaction, CashTransaction]
+
+# Quantization targets for output formatting. quantize + format(..., "f")
+# is markedly faster than routing Decimals through the general f-string
+# __format__ path, and rounds identically (ROUND_HALF_EVEN).
+_MONEY_Q = Decimal("0.01")
+_SHARE_Q = Decimal("0.000001")
+
+
+# Memo strings repeat byte-for-byte across rows with the same ticker, so
+# cache them instead of re-allocating an identical f-string per row.
+@functools.lru_cache(maxsize=4096)
+def _fee_memo(ticker: Optional[str]) -> str:
+    return f"Currency conversion fee for {ticker}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _tax_memo(tax_type: Optional[str], ticker: Optional[str]) -> str:
+    if tax_type == "french":
+        return f"French transaction tax for {ticker}"
+    if tax_type == "stamp_duty":
+        return f"Stamp duty reserve tax for {ticker}"
+    return f"Transaction tax for {ticker}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _purchase_memo(shares_str: str, gnucash_ticker: str) -> str:
+    return f"Purchase of {shares_str} shares @ {gnucash_ticker}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _sale_memo(shares_str: str, gnucash_ticker: str) -> str:
+    return f"Sale of {shares_str} shares @ {gnucash_ticker}"
 
 
 class Trading212Converter:
@@ -35,114 +80,168 @@ class Trading212Converter:
         self.logger = logging.getLogger(__name__)
         self.config = config or Config()
 
-    def validate_csv_file(self, input_file: Union[str, Path]) -> bool:
+        # Config values read on every transaction, bound once here;
+        # Config is frozen so they cannot go stale
+        self._deposit_account = self.config.deposit_account
+        self._interest_account = self.config.interest_account
+        self._conversion_fee_account = self.config.expense_accounts.conversion_fee
+        self._get_tax_account = self.config.get_tax_account
+        self._ticker_get = self.config.ticker_map.get
+
+        # Action-to-handler dispatch; one dict lookup per transaction
+        # instead of a chain of string comparisons
+        self._dispatch = {
+            "Deposit": self._convert_deposit,
+            "Interest on cash": self._convert_interest,
+            "Market buy": self._convert_trading_transaction,
+            "Market sell": self._convert_trading_transaction,
+            "Limit buy": self._convert_trading_transaction,
+            "Limit sell": self._convert_trading_transaction,
+        }
+
+    # Headers every Trading 212 export must have
+    CORE_REQUIRED_HEADERS = (
+        "Action",
+        "Time",
+        "ISIN",
+        "Ticker",
+        "Name",
+        "Notes",
+        "ID",
+        "Total",
+        "Currency (Total)",
+    )
+
+    # Headers needed for buy/sell rows; absence is a warning, not an error
+    TRADING_HEADERS = (
+        "No. of shares",
+        "Price / share",
+        "Currency (Price / share)",
+        "Exchange rate",
+        "Currency (Result)",
+    )
+
+    def validate_csv_file(self, input_file: Union[str, Path, IO[str]]) -> bool:
         """Validate that the input CSV file has the expected format."""
-        input_file = Path(input_file)
-
-        if not input_file.exists():
-            self.logger.error(f"Input file does not exist: {input_file}")
-            return False
-
         try:
-            with open(input_file, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                headers = reader.fieldnames or []
-
-                # Core required headers
-                core_required_headers = [
-                    "Action",
-                    "Time",
-                    "ISIN",
-                    "Ticker",
-                    "Name",
-                    "Notes",
-                    "ID",
-                    "Total",
-                    "Currency (Total)",
-                ]
-
-                # Check for core headers
-                missing_core = [h for h in core_required_headers if h not in headers]
-                if missing_core:
-                    self.logger.error(f"Missing required headers: {missing_core}")
-                    return False
-
-                self.logger.info(f"CSV contains {len(headers)} columns")
-                self.logger.debug(f"Headers: {', '.join(headers)}")
-
-                # Check for trading-specific headers
-                trading_headers = [
-                    "No. of shares",
-                    "Price / share",
-                    "Currency (Price / share)",
-                    "Exchange rate",
-                    "Currency (Result)",
-                ]
-
-                missing_trading = [h for h in trading_headers if h not in headers]
-                if missing_trading:
-                    self.logger.warning(
-                        f"Missing trading headers: {missing_trading}. "
-                        "This may cause issues with buy/sell transactions."
-                    )
-
+            # Header validation lives in read_transactions; pulling the
+            # first transaction is enough to trigger it
+            next(self.read_transactions(input_file), None)
         except Exception as e:
-            self.logger.error(f"Error reading input file: {e}")
+            self.logger.error("Error reading input file: %s", e)
             return False
 
         return True
 
     def read_transactions(
-        self, input_file: Union[str, Path]
-    ) -> Iterator[Trading212Transaction]:
-        """Read and parse Trading 212 transactions from CSV file."""
-        input_file = Path(input_file)
-
-        with open(input_file, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row_num, row in enumerate(reader, 1):
-                try:
-                    # Clean up the row data - handle None values and empty strings
-                    cleaned_row: dict[str, Optional[str]] = {}
-                    for key, value in row.items():
-                        if value is None or value == "":
-                            cleaned_row[key] = None
-                        else:
-                            cleaned_row[key] = (
-                                value.strip() if isinstance(value, str) else value
-                            )
-
-                    transaction = Trading212Transaction(**cleaned_row)  # type: ignore[arg-type]
-                    yield transaction
-
-                except Exception as e:
-                    self.logger.error(f"Error parsing row {row_num}: {e}")
-                    self.logger.debug(f"Row data: {row}")
-                    continue
-
-    def convert_transaction(
-        self, transaction: Trading212Transaction
-    ) -> ConversionResult:
+        self, input_file: Union[str, Path, IO[str]]
+    ) -> Iterator[Transaction]:
+        """Read and parse Trading 212 transactions from a CSV file.
+
+        input_file may be a path or an already-open text-mode file-like
+        object (anything with a read method); the latter is not closed
+        here. The header row is validated before the first transaction is
+        yielded; missing core headers raise ValueError, so callers read
+        and validate the input in a single pass.
+        """
+        # Already-open streams (e.g. io.StringIO in tests) skip the
+        # filesystem entirely
+        if hasattr(input_file, "read"):
+            # hasattr does not narrow the union for mypy, hence the cast
+            yield from self._iter_transactions(cast(IO[str], input_file))
+            return
+
+        # EAFP: a missing file surfaces as FileNotFoundError from open()
+        # rather than costing an up-front exists() stat
+        if not isinstance(input_file, Path):
+            input_file = Path(input_file)
+
+        # A 1 MiB buffer cuts read() syscalls on multi-MB exports, and
+        # errors="replace" keeps a stray bad byte from aborting the whole
+        # read — a replaced character in one field fails at most that row
+        with open(
+            input_file,
+            newline="",
+            encoding="utf-8",
+            errors="replace",
+            buffering=1 << 20,
+        ) as f:
+            yield from self._iter_transactions(f)
+
+    def _iter_transactions(self, f: IO[str]) -> Iterator[Transaction]:
+        """Parse transactions from an open CSV stream."""
+        # csv.reader yields bare lists, avoiding DictReader's per-row
+        # dict construction; column positions are resolved once below
+        reader = csv.reader(f)
+        headers = next(reader, None) or []
+
+        headers_set = set(headers)
+        missing_core = [h for h in self.CORE_REQUIRED_HEADERS if h not in headers_set]
+        if missing_core:
+            raise ValueError(f"Missing required headers: {missing_core}")
+
+        self.logger.info("CSV contains %d columns", len(headers))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Headers: %s", ", ".join(headers))
+
+        missing_trading = [h for h in self.TRADING_HEADERS if h not in headers_set]
+        if missing_trading:
+            self.logger.warning(
+                "Missing trading headers: %s. "
+                "This may cause issues with buy/sell transactions.",
+                missing_trading,
+            )
+
+        idx = {name: i for i, name in enumerate(headers)}
+        col_indices = tuple(idx.get(alias) for alias in _ALIAS_MAP)
+        cash_indices = (
+            idx.get("Action"),
+            idx.get("Time"),
+            idx.get("Notes"),
+            idx.get("ID"),
+            idx.get("Total"),
+            idx.get("Currency (Total)"),
+        )
+        action_i = idx["Action"]
+
+        for row_num, row in enumerate(reader, 1):
+            if not row:
+                continue
+
+            try:
+                # Deposit/interest rows only need a handful of fields,
+                # so they skip the full-row parse
+                # Interned so the CASH_ACTIONS and dispatch lookups
+                # compare by identity for repeated actions
+                action = (
+                    sys.intern(row[action_i].strip()) if action_i < len(row) else ""
+                )
+                if action in CASH_ACTIONS:
+                    yield CashTransaction.from_row_list(row, cash_indices)
+                else:
+                    yield Trading212Transaction.from_row_list(row, col_indices)
+
+            except Exception as e:
+                self.logger.error("Error parsing row %d: %s", row_num, e)
+                self.logger.debug("Row data: %s", row)
+                continue
+
+    def convert_transaction(self, transaction: Transaction) -> ConversionResult:
         """Convert a single Trading212 transaction to GnuCash splits."""
         try:
-            if transaction.action == "Deposit":
-                return self._convert_deposit(transaction)
-            elif transaction.action == "Interest on cash":
-                return self._convert_interest(transaction)
-            elif transaction.is_trading_action():
-                return self._convert_trading_transaction(transaction)
-            else:
+            handler = self._dispatch.get(transaction.action)
+            if handler is None:
                 return ConversionResult(
                     splits=[], errors=[f"Unsupported action type: {transaction.action}"]
                 )
+            return handler(transaction)
 
         except Exception as e:
             return ConversionResult(
                 splits=[], errors=[f"Error converting transaction: {e}"]
             )
 
-    def _convert_deposit(self, transaction: Trading212Transaction) -> ConversionResult:
+    def _convert_deposit(self, transaction: Transaction) -> ConversionResult:
         """Convert a deposit transaction."""
         description = "Deposit from Trading 212"
         if transaction.notes:
@@ -159,13 +258,13 @@ class Trading212Converter:
             number=transaction.id,
             description=description,
             memo=memo,
-            account=self.config.deposit_account,
-            value=f"{abs(transaction.total):.2f}",
+            account=self._deposit_account,
+            value=format(abs(transaction.total).quantize(_MONEY_Q), "f"),
         )
 
         return ConversionResult(splits=[split])
 
-    def _convert_interest(self, transaction: Trading212Transaction) -> ConversionResult:
+    def _convert_interest(self, transaction: Transaction) -> ConversionResult:
         """Convert an interest payment transaction."""
         description = "Interest on cash from Trading 212"
         if transaction.notes:
@@ -182,23 +281,30 @@ class Trading212Converter:
             number=transaction.id,
             description=description,
             memo=memo,
-            account=self.config.interest_account,
-            value=f"{abs(transaction.total):.2f}",
+            account=self._interest_account,
+            value=format(abs(transaction.total).quantize(_MONEY_Q), "f"),
         )
 
         return ConversionResult(splits=[split])
 
     def _convert_trading_transaction(
-        self, transaction: Trading212Transaction
+        self, transaction: Transaction
     ) -> ConversionResult:
         """Convert a trading transaction (buy/sell)."""
-        splits = []
+        # Only buy/sell actions dispatch here, and those always parse as
+        # Trading212Transaction — CashTransaction covers cash actions only
+        assert isinstance(transaction, Trading212Transaction)
         warnings = []
 
-        # Validate required fields for trading
-        if not all(
-            [transaction.num_shares, transaction.price_per_share, transaction.ticker]
-        ):
+        # Bind the fields read repeatedly below to locals once
+        num_shares = transaction.num_shares
+        ticker = transaction.ticker
+        time = transaction.time
+        tid = transaction.id
+
+        # Validate required fields for trading; an and-chain (rather than
+        # all()) so mypy narrows num_shares for the quantize below
+        if not (num_shares and transaction.price_per_share and ticker):
             return ConversionResult(
                 splits=[],
                 errors=["Missing required trading data (shares, price, or ticker)"],
@@ -210,64 +316,59 @@ class Trading212Converter:
             warnings.append("Could not calculate GBP price, using original price")
             price_gbp = transaction.price_per_share
 
-        # Get ticker mapping
-        ticker = transaction.ticker or ""
-        gnucash_ticker = self.config.get_gnucash_ticker(ticker)
-        if (
-            gnucash_ticker == transaction.ticker
-            and transaction.ticker not in self.config.ticker_map
-        ):
-            warnings.append(f"No ticker mapping found for {transaction.ticker}")
+        # Get ticker mapping; a single dict probe gives both the mapped
+        # symbol and whether a mapping exists
+        mapped = self._ticker_get(ticker or "")
+        gnucash_ticker = mapped if mapped is not None else (ticker or "")
+        if mapped is None:
+            warnings.append(f"No ticker mapping found for {ticker}")
 
-        # Calculate net amount for shares (total minus fees and taxes)
+        # Calculate net amount for shares (total minus fees and taxes);
+        # the tax amount and type come from a single pass over the fields
         conversion_fee = transaction.conversion_fee or Decimal("0")
-        transaction_tax = transaction.get_transaction_tax() or Decimal("0")
+        tax, tax_type = transaction.get_tax()
+        transaction_tax = tax or Decimal("0")
         net_shares_amount = transaction.total - conversion_fee - transaction_tax
 
         # Create description
-        company_display = transaction.name or transaction.ticker
-        description = f"{transaction.action} {transaction.num_shares:.6f} shares of {company_display} ({transaction.ticker})"
+        company_display = transaction.name or ticker
+        shares_str = format(num_shares.quantize(_SHARE_Q), "f")
+        description = (
+            f"{transaction.action} {shares_str} shares of {company_display} ({ticker})"
+        )
 
-        # Main share transaction split
+        # Main share transaction split; shares_str is passed along so the
+        # quantize/format work above is not repeated
         share_split = self._create_share_split(
-            transaction, description, gnucash_ticker, net_shares_amount
+            transaction, description, gnucash_ticker, net_shares_amount, shares_str
         )
-        splits.append(share_split)
 
         # Conversion fee split (if non-zero)
+        fee_split = None
         if conversion_fee != 0:
             fee_split = GnuCashSplit(
-                date=transaction.time,
-                number=transaction.id,
+                date=time,
+                number=tid,
                 description=description,
-                memo=f"Currency conversion fee for {transaction.ticker}",
-                account=self.config.expense_accounts.conversion_fee,
-                value=f"{abs(conversion_fee):.2f}",
+                memo=_fee_memo(ticker),
+                account=self._conversion_fee_account,
+                value=format(abs(conversion_fee).quantize(_MONEY_Q), "f"),
             )
-            splits.append(fee_split)
 
         # Transaction tax split (if non-zero)
+        tax_split = None
         if transaction_tax != 0:
-            tax_type = transaction.get_tax_type()
-            tax_account = self.config.get_tax_account(tax_type or "french")
-
-            if tax_type == "french":
-                tax_memo = f"French transaction tax for {transaction.ticker}"
-            elif tax_type == "stamp_duty":
-                tax_memo = f"Stamp duty reserve tax for {transaction.ticker}"
-            else:
-                tax_memo = f"Transaction tax for {transaction.ticker}"
-
             tax_split = GnuCashSplit(
-                date=transaction.time,
-                number=transaction.id,
+                date=time,
+                number=tid,
                 description=description,
-                memo=tax_memo,
-                account=tax_account,
-                value=f"{abs(transaction_tax):.2f}",
+                memo=_tax_memo(tax_type, ticker),
+                account=self._get_tax_account(tax_type or "french"),
+                value=format(abs(transaction_tax).quantize(_MONEY_Q), "f"),
             )
-            splits.append(tax_split)
 
+        # Build the splits list in one shot instead of growing it
+        splits = [s for s in (share_split, fee_split, tax_split) if s is not None]
         return ConversionResult(splits=splits, warnings=warnings)
 
     def _create_share_split(
@@ -276,14 +377,23 @@ class Trading212Converter:
         description: str,
         gnucash_ticker: str,
         net_amount: Decimal,
+        shares_str: Optional[str] = None,
     ) -> GnuCashSplit:
-        """Create the main share transaction split."""
+        """Create the main share transaction split.
+
+        shares_str lets the caller supply the already-formatted share
+        count instead of quantizing num_shares a second time.
+        """
+        if shares_str is None:
+            num_shares = transaction.num_shares
+            assert num_shares is not None, "share split requires num_shares"
+            shares_str = format(num_shares.quantize(_SHARE_Q), "f")
         if transaction.is_buy_action():
-            memo = f"Purchase of {transaction.num_shares:.6f} shares @ {gnucash_ticker}"
-            amount = f"{transaction.num_shares:.6f}"
+            memo = _purchase_memo(shares_str, gnucash_ticker)
+            amount = shares_str
         else:  # sell action
-            memo = f"Sale of {transaction.num_shares:.6f} shares @ {gnucash_ticker}"
-            amount = f"-{transaction.num_shares:.6f}"
+            memo = _sale_memo(shares_str, gnucash_ticker)
+            amount = f"-{shares_str}"
 
         return GnuCashSplit(
             date=transaction.time,
@@ -293,46 +403,97 @@ class Trading212Converter:
             account=transaction.name or transaction.ticker or "Unknown",
             transaction_commodity=gnucash_ticker,
             amount=amount,
-            value=f"{abs(net_amount):.2f}",
+            value=format(abs(net_amount).quantize(_MONEY_Q), "f"),
         )
 
     def _calculate_gbp_price(
         self, transaction: Trading212Transaction
     ) -> Optional[Decimal]:
         """Calculate GBP price per share using available exchange rate data."""
+        price_per_share = transaction.price_per_share
+        exchange_rate = transaction.exchange_rate
+        num_shares = transaction.num_shares
+
         # Method 1: Use exchange rate if available
-        if (
-            transaction.price_currency
-            and transaction.price_currency != "GBP"
-            and transaction.exchange_rate
-            and transaction.exchange_rate != 0
-        ):
-            if transaction.price_per_share is not None:
-                return transaction.price_per_share / transaction.exchange_rate
+        price_currency = transaction.price_currency
+        if price_currency and price_currency != "GBP" and exchange_rate:
+            if price_per_share is not None:
+                return price_per_share / exchange_rate
             return None
 
         # Method 2: Calculate from total amount
-        if (
-            transaction.total_currency == "GBP"
-            and transaction.num_shares
-            and transaction.num_shares != 0
-        ):
-            return abs(transaction.total) / transaction.num_shares
+        if transaction.total_currency == "GBP" and num_shares:
+            return abs(transaction.total) / num_shares
 
         # Method 3: Assume already in GBP
-        return transaction.price_per_share
+        return price_per_share
+
+    def _iter_converted_splits(
+        self, input_file: Union[str, Path, IO[str]]
+    ) -> Iterator[GnuCashSplit]:
+        """Read, convert and yield splits, logging errors and warnings.
+
+        Shared pipeline behind convert_file and convert_to_list; the
+        summary counts are logged once the input is exhausted.
+        """
+        processed_count = 0
+        error_count = 0
+        warning_count = 0
+
+        for transaction in self.read_transactions(input_file):
+            result = self.convert_transaction(transaction)
+
+            if result.errors:
+                error_count += len(result.errors)
+                for error in result.errors:
+                    self.logger.error("Transaction %s: %s", transaction.id, error)
+                continue
+
+            if result.warnings:
+                warning_count += len(result.warnings)
+                for warning in result.warnings:
+                    self.logger.warning("Transaction %s: %s", transaction.id, warning)
+
+            yield from result.splits
+
+            processed_count += 1
+
+        self.logger.info("Successfully processed %d transactions", processed_count)
+        if error_count > 0:
+            self.logger.warning("Encountered %d errors", error_count)
+        if warning_count > 0:
+            self.logger.info("Generated %d warnings", warning_count)
+
+    def convert_to_list(
+        self, input_file: Union[str, Path, IO[str]]
+    ) -> "list[GnuCashSplit]":
+        """Convert a Trading 212 export and return the resulting splits.
+
+        The same pipeline as convert_file without the CSV write, for
+        callers (and tests) that want the results in memory. Raises
+        ValueError for a malformed header, like read_transactions.
+        """
+        return list(self._iter_converted_splits(input_file))
 
     def convert_file(
-        self, input_file: Union[str, Path], output_file: Union[str, Path]
+        self, input_file: Union[str, Path, IO[str]], output_file: Union[str, Path]
     ) -> bool:
-        """Convert entire Trading212 CSV file to GnuCash format."""
-        input_file = Path(input_file)
-        output_file = Path(output_file)
+        """Convert entire Trading212 CSV file to GnuCash format.
 
-        if not self.validate_csv_file(input_file):
-            return False
+        input_file may be a path or an open text-mode file-like object.
+        Validation happens inline in read_transactions, so the input is
+        opened and scanned exactly once.
+        """
+        if not isinstance(output_file, Path):
+            output_file = Path(output_file)
 
         try:
+            # Pull the first split before opening the output file; header
+            # validation fires on the first read, so a malformed input
+            # fails here rather than leaving behind a header-only stub
+            splits = self._iter_converted_splits(input_file)
+            first = next(splits, None)
+
             # GnuCash multi-split CSV headers
             headers = [
                 "Date",
@@ -345,47 +506,19 @@ class Trading212Converter:
                 "Value",
             ]
 
-            with open(output_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-
-                processed_count = 0
-                error_count = 0
-                warning_count = 0
-
-                for transaction in self.read_transactions(input_file):
-                    result = self.convert_transaction(transaction)
-
-                    if result.errors:
-                        error_count += len(result.errors)
-                        for error in result.errors:
-                            self.logger.error(f"Transaction {transaction.id}: {error}")
-                        continue
-
-                    if result.warnings:
-                        warning_count += len(result.warnings)
-                        for warning in result.warnings:
-                            self.logger.warning(
-                                f"Transaction {transaction.id}: {warning}"
-                            )
-
-                    # Write all splits for this transaction
-                    for split in result.splits:
-                        writer.writerow(split.to_dict())
-
-                    processed_count += 1
-
-                self.logger.info(
-                    f"Successfully processed {processed_count} transactions"
-                )
-                if error_count > 0:
-                    self.logger.warning(f"Encountered {error_count} errors")
-                if warning_count > 0:
-                    self.logger.info(f"Generated {warning_count} warnings")
+            # A 1 MiB buffer amortizes write syscalls on large outputs
+            with open(
+                output_file, "w", newline="", encoding="utf-8", buffering=1 << 20
+            ) as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                if first is not None:
+                    writer.writerow(first.as_row())
+                    writer.writerows(split.as_row() for split in splits)
 
-                self.logger.info(f"Output written to: {output_file}")
-                return True
+            self.logger.info("Output written to: %s", output_file)
+            return True
 
         except Exception as e:
-            self.logger.error(f"Error processing file: {e}")
+            self.logger.error("Error processing file: %s", e)
             return False
@@ -16,95 +16,58 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from decimal import Decimal
-from typing import Optional, Union
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-
-
-class Trading212Transaction(BaseModel):
-    """Model for a Trading 212 CSV transaction row."""
-
-    action: str = Field(
-        ...,
-        alias="Action",
-        description="Transaction type (Market buy, Market sell, etc.)",
-    )
-    time: str = Field(..., alias="Time", description="Transaction timestamp")
-    isin: Optional[str] = Field(
-        None, alias="ISIN", description="International Securities Identification Number"
-    )
-    ticker: Optional[str] = Field(
-        None, alias="Ticker", description="Stock ticker symbol"
-    )
-    name: Optional[str] = Field(None, alias="Name", description="Full company name")
-    notes: Optional[str] = Field(None, alias="Notes", description="Additional notes")
-    id: str = Field(..., alias="ID", description="Transaction ID")
-    num_shares: Optional[Decimal] = Field(
-        None, alias="No. of shares", description="Number of shares traded"
-    )
-    price_per_share: Optional[Decimal] = Field(
-        None, alias="Price / share", description="Price per share"
-    )
-    price_currency: Optional[str] = Field(
-        None, alias="Currency (Price / share)", description="Currency of share price"
-    )
-    exchange_rate: Optional[Decimal] = Field(
-        None, alias="Exchange rate", description="Exchange rate used"
-    )
-    result_currency: Optional[str] = Field(
-        None, alias="Currency (Result)", description="Result currency"
-    )
-    total: Decimal = Field(..., alias="Total", description="Total transaction amount")
-    total_currency: str = Field(
-        ..., alias="Currency (Total)", description="Currency of total amount"
-    )
-    conversion_fee: Optional[Decimal] = Field(
-        None, alias="Currency conversion fee", description="Conversion fee"
-    )
-    conversion_fee_currency: Optional[str] = Field(
-        None,
-        alias="Currency (Currency conversion fee)",
-        description="Conversion fee currency",
-    )
-    french_tax: Optional[Decimal] = Field(
-        None, alias="French transaction tax", description="French transaction tax"
-    )
-    french_tax_currency: Optional[str] = Field(
-        None,
-        alias="Currency (French transaction tax)",
-        description="French tax currency",
-    )
-    stamp_duty_tax: Optional[Decimal] = Field(
-        None, alias="Stamp duty reserve tax", description="Stamp duty reserve tax"
-    )
-    stamp_duty_tax_currency: Optional[str] = Field(
-        None,
-        alias="Currency (Stamp duty reserve tax)",
-        description="Stamp duty tax currency",
-    )
-
-    model_config = ConfigDict(populate_by_name=True)
-
-    @field_validator("action")
-    @classmethod
-    def validate_action(cls, v: str) -> str:
-        """Validate that action is one of the supported types."""
-        supported_actions = [
-            "Market buy",
-            "Market sell",
-            "Limit buy",
-            "Limit sell",
-            "Deposit",
-            "Interest on cash",
-        ]
-        if v not in supported_actions:
-            raise ValueError(
-                f"Unsupported action type: {v}. Supported: {supported_actions}"
-            )
-        return v
-
-    @field_validator(
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional
+
+# Frozensets for the per-row membership checks in the action helpers
+_BUY_ACTIONS = frozenset({"Market buy", "Limit buy"})
+_SELL_ACTIONS = frozenset({"Market sell", "Limit sell"})
+_TRADING_ACTIONS = _BUY_ACTIONS | _SELL_ACTIONS
+
+# Actions that take the lightweight CashTransaction path when reading
+CASH_ACTIONS = frozenset({"Deposit", "Interest on cash"})
+
+# Fields parsed on the cash path, in the order callers supply indices
+_CASH_FIELDS = ("action", "time", "notes", "id", "total", "total_currency")
+
+# CSV column header -> Trading212Transaction attribute
+_ALIAS_MAP = {
+    "Action": "action",
+    "Time": "time",
+    "ISIN": "isin",
+    "Ticker": "ticker",
+    "Name": "name",
+    "Notes": "notes",
+    "ID": "id",
+    "No. of shares": "num_shares",
+    "Price / share": "price_per_share",
+    "Currency (Price / share)": "price_currency",
+    "Exchange rate": "exchange_rate",
+    "Currency (Result)": "result_currency",
+    "Total": "total",
+    "Currency (Total)": "total_currency",
+    "Currency conversion fee": "conversion_fee",
+    "Currency (Currency conversion fee)": "conversion_fee_currency",
+    "French transaction tax": "french_tax",
+    "Currency (French transaction tax)": "french_tax_currency",
+    "Stamp duty reserve tax": "stamp_duty_tax",
+    "Currency (Stamp duty reserve tax)": "stamp_duty_tax_currency",
+}
+
+# Attribute names in CSV column order, for positional row parsing
+_FIELD_ORDER = tuple(_ALIAS_MAP.values())
+
+# Attributes that must be non-empty for a row to be usable; an empty
+# one raises ValueError so the reader's per-row error handling logs and
+# skips the row instead of writing zero-valued splits
+_REQUIRED_FIELDS = frozenset({"action", "time", "id", "total"})
+
+# Attributes parsed as Decimal in from_row; everything else stays a string
+_DECIMAL_FIELDS = frozenset(
+    {
         "num_shares",
         "price_per_share",
         "exchange_rate",
@@ -112,80 +75,256 @@ class Trading212Transaction(BaseModel):
         "conversion_fee",
         "french_tax",
         "stamp_duty_tax",
-        mode="before",
-    )
-    @classmethod
-    def parse_decimal(cls, v: Union[str, float, int, None]) -> Optional[Decimal]:
-        """Parse decimal values, handling empty strings."""
-        if v == "" or v is None:
-            return None
-        try:
-            return Decimal(str(v))
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid decimal value: {v}") from e
-
-    @field_validator(
-        "isin",
-        "ticker",
-        "name",
-        "notes",
+    }
+)
+
+# Low-cardinality columns repeated on nearly every row; interning them
+# collapses the duplicates to one object per distinct value and lets
+# later dict/set lookups on them hit the identity fast path
+_INTERN_FIELDS = frozenset(
+    {
+        "action",
         "price_currency",
         "result_currency",
         "total_currency",
         "conversion_fee_currency",
         "french_tax_currency",
         "stamp_duty_tax_currency",
-        mode="before",
-    )
+    }
+)
+
+
+@dataclass
+class Trading212Transaction:
+    """A Trading 212 CSV transaction row.
+
+    A plain dataclass rather than a Pydantic model: from_row does the alias
+    lookup and Decimal parsing in a single pass, which is substantially
+    cheaper per row than running a full validator pipeline on large exports.
+    """
+
+    action: str = ""
+    time: str = ""
+    isin: Optional[str] = None
+    ticker: Optional[str] = None
+    name: Optional[str] = None
+    notes: Optional[str] = None
+    id: str = ""
+    num_shares: Optional[Decimal] = None
+    price_per_share: Optional[Decimal] = None
+    price_currency: Optional[str] = None
+    exchange_rate: Optional[Decimal] = None
+    result_currency: Optional[str] = None
+    total: Decimal = Decimal("0")
+    total_currency: str = ""
+    conversion_fee: Optional[Decimal] = None
+    conversion_fee_currency: Optional[str] = None
+    french_tax: Optional[Decimal] = None
+    french_tax_currency: Optional[str] = None
+    stamp_duty_tax: Optional[Decimal] = None
+    stamp_duty_tax_currency: Optional[str] = None
+
     @classmethod
-    def parse_string(cls, v: Optional[str]) -> Optional[str]:
-        """Parse string values, handling None and empty strings."""
-        if v is None or v == "":
-            return None
-        return str(v).strip() if v else None
+    def from_row(cls, row: Mapping[str, Optional[str]]) -> "Trading212Transaction":
+        """Build a transaction from a CSV row keyed by column header.
+
+        Empty and missing optional columns become None (or the field
+        default); numeric columns are parsed as Decimal. Raises
+        ValueError for an unparseable number or an empty required
+        column. Action legality is not checked here — the converter's
+        dispatch already rejects unknown actions, so validating twice
+        per row would be wasted work.
+        """
+        kwargs: dict[str, Any] = {}
+        for alias, attr in _ALIAS_MAP.items():
+            value = row.get(alias)
+            if value:
+                value = value.strip()
+            if not value:
+                continue
+            if attr in _DECIMAL_FIELDS:
+                try:
+                    kwargs[attr] = Decimal(value)
+                except (InvalidOperation, ValueError) as e:
+                    raise ValueError(f"Invalid decimal value: {value}") from e
+            elif attr in _INTERN_FIELDS:
+                kwargs[attr] = sys.intern(value)
+            else:
+                kwargs[attr] = value
+
+        missing = _REQUIRED_FIELDS.difference(kwargs)
+        if missing:
+            raise ValueError(f"Missing required fields: {sorted(missing)}")
+
+        return cls(**kwargs)
+
+    @classmethod
+    def from_row_list(
+        cls, row: "list[str]", col_indices: "tuple[Optional[int], ...]"
+    ) -> "Trading212Transaction":
+        """Build a transaction from a positional CSV row.
+
+        col_indices maps each attribute (in _FIELD_ORDER order) to its
+        column index, or None when the column is absent; the caller
+        resolves it once from the header. Avoids the per-row dict that
+        csv.DictReader would otherwise allocate.
+        """
+        kwargs: dict[str, Any] = {}
+        n = len(row)
+        for attr, i in zip(_FIELD_ORDER, col_indices):
+            if i is None or i >= n:
+                continue
+            value = row[i]
+            if value:
+                value = value.strip()
+            if not value:
+                continue
+            if attr in _DECIMAL_FIELDS:
+                try:
+                    kwargs[attr] = Decimal(value)
+                except (InvalidOperation, ValueError) as e:
+                    raise ValueError(f"Invalid decimal value: {value}") from e
+            elif attr in _INTERN_FIELDS:
+                kwargs[attr] = sys.intern(value)
+            else:
+                kwargs[attr] = value
+
+        missing = _REQUIRED_FIELDS.difference(kwargs)
+        if missing:
+            raise ValueError(f"Missing required fields: {sorted(missing)}")
+
+        return cls(**kwargs)
 
     def is_trading_action(self) -> bool:
         """Check if this is a trading action (buy/sell)."""
-        return self.action in ["Market buy", "Market sell", "Limit buy", "Limit sell"]
+        return self.action in _TRADING_ACTIONS
 
     def is_buy_action(self) -> bool:
         """Check if this is a buy action."""
-        return self.action in ["Market buy", "Limit buy"]
+        return self.action in _BUY_ACTIONS
 
     def is_sell_action(self) -> bool:
         """Check if this is a sell action."""
-        return self.action in ["Market sell", "Limit sell"]
+        return self.action in _SELL_ACTIONS
+
+    def get_tax(self) -> "tuple[Optional[Decimal], Optional[str]]":
+        """Get the transaction tax amount and its type in one pass."""
+        if self.french_tax:
+            return self.french_tax, "french"
+        if self.stamp_duty_tax:
+            return self.stamp_duty_tax, "stamp_duty"
+        return None, None
 
     def get_transaction_tax(self) -> Optional[Decimal]:
         """Get the transaction tax amount (French or Stamp Duty)."""
-        if self.french_tax and self.french_tax != 0:
-            return self.french_tax
-        elif self.stamp_duty_tax and self.stamp_duty_tax != 0:
-            return self.stamp_duty_tax
-        return None
+        return self.get_tax()[0]
 
     def get_tax_type(self) -> Optional[str]:
         """Get the type of transaction tax."""
-        if self.french_tax and self.french_tax != 0:
-            return "french"
-        elif self.stamp_duty_tax and self.stamp_duty_tax != 0:
-            return "stamp_duty"
+        return self.get_tax()[1]
+
+
+@dataclass
+class CashTransaction:
+    """Lightweight row for cash actions (Deposit, Interest on cash).
+
+    Cash rows never carry trading columns, so parsing just the handful of
+    fields the cash converters need skips most of the full row parse.
+    ticker/isin/name are fixed at None for interface parity with
+    Trading212Transaction.
+    """
+
+    action: str = ""
+    time: str = ""
+    notes: Optional[str] = None
+    id: str = ""
+    total: Decimal = Decimal("0")
+    total_currency: str = ""
+    ticker: Optional[str] = None
+    isin: Optional[str] = None
+    name: Optional[str] = None
+
+    @classmethod
+    def from_row_list(
+        cls, row: "list[str]", col_indices: "tuple[Optional[int], ...]"
+    ) -> "CashTransaction":
+        """Build a cash transaction from a positional CSV row.
+
+        col_indices maps _CASH_FIELDS to column positions, resolved once
+        by the caller from the header.
+        """
+        kwargs: dict[str, Any] = {}
+        n = len(row)
+        for attr, i in zip(_CASH_FIELDS, col_indices):
+            if i is None or i >= n:
+                continue
+            value = row[i]
+            if value:
+                value = value.strip()
+            if not value:
+                continue
+            if attr == "total":
+                try:
+                    kwargs[attr] = Decimal(value)
+                except (InvalidOperation, ValueError) as e:
+                    raise ValueError(f"Invalid decimal value: {value}") from e
+            elif attr == "action" or attr == "total_currency":
+                kwargs[attr] = sys.intern(value)
+            else:
+                kwargs[attr] = value
+
+        missing = _REQUIRED_FIELDS.difference(kwargs)
+        if missing:
+            raise ValueError(f"Missing required fields: {sorted(missing)}")
+
+        return cls(**kwargs)
+
+    def is_trading_action(self) -> bool:
+        """Cash transactions are never trades."""
+        return False
+
+    def is_buy_action(self) -> bool:
+        """Cash transactions are never buys."""
+        return False
+
+    def is_sell_action(self) -> bool:
+        """Cash transactions are never sells."""
+        return False
+
+    def get_transaction_tax(self) -> Optional[Decimal]:
+        """Cash transactions carry no transaction tax."""
         return None
 
+    def get_tax_type(self) -> Optional[str]:
+        """Cash transactions carry no transaction tax."""
+        return None
+
+
+@dataclass
+class GnuCashSplit:
+    """A GnuCash multi-split transaction row; a plain record, no validation."""
 
-class GnuCashSplit(BaseModel):
-    """Model for a GnuCash multi-split transaction row."""
+    date: str = ""
+    number: str = ""
+    description: str = ""
+    memo: str = ""
+    account: str = ""
+    transaction_commodity: str = ""
+    amount: str = ""
+    value: str = ""
 
-    date: str = Field(..., description="Transaction date")
-    number: str = Field(default="", description="Transaction number/ID")
-    description: str = Field(..., description="Transaction description")
-    memo: str = Field(default="", description="Split memo")
-    account: str = Field(..., description="Account for this split")
-    transaction_commodity: str = Field(
-        default="", description="Transaction commodity (stock symbol)"
-    )
-    amount: str = Field(default="", description="Amount (for shares)")
-    value: str = Field(..., description="Value in base currency")
+    def as_row(self) -> tuple[str, str, str, str, str, str, str, str]:
+        """Return the split as a CSV row tuple, in output column order."""
+        return (
+            self.date,
+            self.number,
+            self.description,
+            self.memo,
+            self.account,
+            self.transaction_commodity,
+            self.amount,
+            self.value,
+        )
 
     def to_dict(self) -> dict[str, str]:
         """Convert to dictionary for CSV writing."""
@@ -201,12 +340,13 @@ class GnuCashSplit(BaseModel):
         }
 
 
-class ConversionResult(BaseModel):
+@dataclass
+class ConversionResult:
     """Result of converting a Trading 212 transaction to GnuCash splits."""
 
-    splits: list[GnuCashSplit] = Field(..., description="List of GnuCash splits")
-    warnings: list[str] = Field(default_factory=list, description="Conversion warnings")
-    errors: list[str] = Field(default_factory=list, description="Conversion errors")
+    splits: "list[GnuCashSplit]"
+    warnings: "list[str]" = field(default_factory=list)
+    errors: "list[str]" = field(default_factory=list)
 
     @property
     def success(self) -> bool:
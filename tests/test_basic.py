@@ -18,6 +18,8 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from decimal import Decimal
 
+import pytest
+
 from trading212_gnucash import Config, Trading212Converter
 from trading212_gnucash.models import GnuCashSplit, Trading212Transaction
 
@@ -69,7 +71,7 @@ def test_transaction_model():
         "Currency (Total)": "GBP",
     }
 
-    transaction = Trading212Transaction(**transaction_data)
+    transaction = Trading212Transaction.from_row(transaction_data)
     assert transaction.action == "Market buy"
     assert transaction.ticker == "MSFT"
     assert transaction.name == "Microsoft Corporation"
@@ -86,12 +88,16 @@ def test_transaction_model():
         "Total": "100.00",
         "Currency (Total)": "GBP",
     }
-    deposit_transaction = Trading212Transaction(**minimal_data)
+    deposit_transaction = Trading212Transaction.from_row(minimal_data)
     assert deposit_transaction.action == "Deposit"
     assert deposit_transaction.ticker is None
     assert deposit_transaction.name is None
     assert deposit_transaction.isin is None
 
+    # Required fields must be non-empty
+    with pytest.raises(ValueError, match="Missing required fields"):
+        Trading212Transaction.from_row({**minimal_data, "Total": ""})
+
 
 def test_gnucash_split_model():
     """Test GnuCashSplit model."""
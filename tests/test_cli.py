@@ -16,105 +16,160 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import csv
 import logging
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch
+import sys
+from collections import Counter
+from types import ModuleType, SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from trading212_gnucash import __version__
+from trading212_gnucash import cli as cli_module
 from trading212_gnucash.cli import cli, main, setup_logging
-from trading212_gnucash.config import Config
+from trading212_gnucash.converter import Trading212Converter
 
+# Subcommands resolved once at import; invoking them directly skips the
+# group's command lookup and group-level option parsing on every call.
+convert_cmd = cli.commands["convert"]
+init_config_cmd = cli.commands["init-config"]
+validate_config_cmd = cli.commands["validate-config"]
+info_cmd = cli.commands["info"]
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def runner():
-    """Click test runner."""
+    """Click test runner, shared across the session; it holds no state
+    between invocations."""
     return CliRunner()
 
 
-@pytest.fixture
-def sample_csv_content():
-    """Sample Trading 212 CSV content for testing."""
-    return """Action,Time,ISIN,Ticker,Name,Notes,ID,No. of shares,Price / share,Currency (Price / share),Exchange rate,Currency (Result),Total,Currency (Total)
-Market buy,2025-01-01 10:00:00.000,US5949181045,MSFT,Microsoft Corporation,,12345,10.5,150.00,USD,0.8,GBP,-1260.00,GBP
-Deposit,2025-01-01 09:00:00.000,,,,,54321,,,,,GBP,1000.00,GBP
-"""
+@pytest.fixture(scope="session")
+def _converter_mock_template():
+    """Canonical converter mock, built once per session.
+
+    Mock construction is a measurable share of fixture setup cost, so the
+    tree is built once and reset between tests by the mock_converter
+    fixture.
+    """
+    return Mock()
 
 
 @pytest.fixture
-def temp_csv_file(sample_csv_content):
-    """Create a temporary CSV file with sample content."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-        f.write(sample_csv_content)
-        temp_path = Path(f.name)
+def mock_converter(_converter_mock_template):
+    """Converter mock reset to the default happy-path behaviour."""
+    mock = _converter_mock_template
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.validate_csv_file.return_value = True
+    mock.convert_file.return_value = True
+    return mock
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture(scope="session")
+def _config_mock_template():
+    """Canonical config mock, built once per session."""
+    return Mock()
 
 
 @pytest.fixture
-def temp_config_file():
-    """Create a temporary config file path."""
-    with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-        temp_path = Path(f.name)
-
-    # Remove the file so tests can create it
-    temp_path.unlink()
+def mock_config(_config_mock_template):
+    """Config mock for tests that never inspect its attributes."""
+    mock = _config_mock_template
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def help_results(runner):
+    """Memoized --help/--version invocations.
+
+    The help tests only assert on exit codes and output substrings, so one
+    invocation per command serves every test that reads it.
+    """
+    results = {
+        cmd: runner.invoke(cli, [cmd, "--help"])
+        for cmd in ("convert", "init-config", "validate-config", "info")
+    }
+    results["--help"] = runner.invoke(cli, ["--help"])
+    results["--version"] = runner.invoke(cli, ["--version"])
+    results[""] = runner.invoke(cli, [])
+    return results
+
+
+@pytest.fixture(scope="session")
+def empty_csv_path(tmp_path_factory):
+    """Empty CSV path satisfying Click's exists=True check.
+
+    Every test that passes this has the converter mocked, so the file is
+    never parsed and needs no content.
+    """
+    path = tmp_path_factory.mktemp("csv") / "input.csv"
+    path.touch()
+    return path
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture
+def temp_config_file(tmp_path):
+    """Path for a config file that does not yet exist."""
+    return tmp_path / "cfg.yaml"
 
 
 class TestSetupLogging:
     """Test logging setup functionality."""
 
-    def test_setup_logging_default(self):
+    def test_setup_logging_default(self, monkeypatch):
         """Test default logging setup."""
-        with patch("trading212_gnucash.cli.logging.basicConfig") as mock_config:
-            setup_logging()
-            mock_config.assert_called_once()
-            args, kwargs = mock_config.call_args
-            assert kwargs["level"] == logging.INFO
+        calls = []
+        monkeypatch.setattr(
+            "trading212_gnucash.cli.logging.basicConfig",
+            lambda **kwargs: calls.append(kwargs),
+        )
+        setup_logging()
+        assert len(calls) == 1
+        assert calls[0]["level"] == logging.INFO
 
-    def test_setup_logging_verbose(self):
+    def test_setup_logging_verbose(self, monkeypatch):
         """Test verbose logging setup."""
-        with patch("trading212_gnucash.cli.logging.basicConfig") as mock_config:
-            setup_logging(verbose=True)
-            mock_config.assert_called_once()
-            args, kwargs = mock_config.call_args
-            assert kwargs["level"] == logging.DEBUG
+        calls = []
+        monkeypatch.setattr(
+            "trading212_gnucash.cli.logging.basicConfig",
+            lambda **kwargs: calls.append(kwargs),
+        )
+        setup_logging(verbose=True)
+        assert len(calls) == 1
+        assert calls[0]["level"] == logging.DEBUG
 
 
 class TestMainCLI:
     """Test main CLI command group."""
 
-    def test_cli_version_flag(self, runner):
+    def test_cli_version_flag(self, help_results):
         """Test --version flag."""
-        result = runner.invoke(cli, ["--version"])
+        result = help_results["--version"]
         assert result.exit_code == 0
         assert f"trading212-gnucash {__version__}" in result.output
 
-    def test_cli_no_command_shows_help(self, runner):
+    def test_cli_no_command_shows_help(self, help_results):
         """Test that CLI shows help when no command is provided."""
-        result = runner.invoke(cli)
+        result = help_results[""]
         assert result.exit_code == 0
-        assert "Trading 212 to GnuCash converter" in result.output
-        assert "Commands:" in result.output
+        assert b"Trading 212 to GnuCash converter" in result.stdout_bytes
+        assert b"Commands:" in result.stdout_bytes
 
-    def test_cli_help(self, runner):
+    def test_cli_help(self, help_results):
         """Test --help flag."""
-        result = runner.invoke(cli, ["--help"])
+        result = help_results["--help"]
+        assert result.exit_code == 0
+        assert b"Trading 212 to GnuCash converter" in result.stdout_bytes
+
+    def test_cli_no_cache_flag(self, runner):
+        """Test that --no-cache disables the configuration cache."""
+        with patch("trading212_gnucash.cli.set_cache_enabled") as mock_set:
+            result = runner.invoke(cli, ["--no-cache"])
         assert result.exit_code == 0
-        assert "Trading 212 to GnuCash converter" in result.output
+        mock_set.assert_called_once_with(False)
 
     def test_main_function(self):
         """Test main function calls cli."""
@@ -126,271 +181,188 @@ class TestMainCLI:
 class TestConvertCommand:
     """Test convert command functionality."""
 
-    def test_convert_help(self, runner):
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """Patch the converter and config entry points in one context."""
+        with patch.multiple(
+            "trading212_gnucash.cli",
+            Trading212Converter=DEFAULT,
+            Config=DEFAULT,
+        ) as mocks:
+            yield mocks
+
+    def test_convert_help(self, help_results):
         """Test convert command help."""
-        result = runner.invoke(cli, ["convert", "--help"])
+        result = help_results["convert"]
         assert result.exit_code == 0
-        assert "Convert Trading 212 CSV file" in result.output
+        assert b"Convert Trading 212 CSV file" in result.stdout_bytes
 
     def test_convert_missing_input_file(self, runner):
         """Test convert with non-existent input file."""
-        result = runner.invoke(cli, ["convert", "nonexistent.csv", "output.csv"])
+        result = runner.invoke(convert_cmd, ["nonexistent.csv", "output.csv"])
         assert result.exit_code == 2
         assert "does not exist" in result.output
 
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
-    def test_convert_success(
-        self, mock_config_class, mock_converter_class, runner, temp_csv_file
-    ):
-        """Test successful conversion."""
-        # Mock configuration
-        mock_config = Mock()
-        mock_config_class.load_from_file.return_value = mock_config
-
-        # Mock converter
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = True
-        mock_converter.convert_file.return_value = True
-        mock_converter_class.return_value = mock_converter
-
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
-            result = runner.invoke(
-                cli, ["convert", str(temp_csv_file), output_file.name]
-            )
-
-        assert result.exit_code == 0
-        assert "Successfully converted" in result.output
-        mock_converter.validate_csv_file.assert_called_once()
-        mock_converter.convert_file.assert_called_once()
-
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
-    def test_convert_validation_failure(
-        self, mock_config_class, mock_converter_class, runner, temp_csv_file
-    ):
-        """Test conversion with validation failure."""
-        # Mock configuration
-        mock_config = Mock()
-        mock_config_class.load_from_file.return_value = mock_config
-
-        # Mock converter with validation failure
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = False
-        mock_converter_class.return_value = mock_converter
-
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
-            result = runner.invoke(
-                cli, ["convert", str(temp_csv_file), output_file.name]
-            )
-
-        assert result.exit_code == 1
-        assert "Input file validation failed" in result.output
-
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
-    def test_convert_conversion_failure(
-        self, mock_config_class, mock_converter_class, runner, temp_csv_file
-    ):
-        """Test conversion with conversion failure."""
-        # Mock configuration
-        mock_config = Mock()
-        mock_config_class.load_from_file.return_value = mock_config
-
-        # Mock converter with conversion failure
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = True
-        mock_converter.convert_file.return_value = False
-        mock_converter_class.return_value = mock_converter
-
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
-            result = runner.invoke(
-                cli, ["convert", str(temp_csv_file), output_file.name]
-            )
-
-        assert result.exit_code == 1
-        assert "Conversion failed" in result.output
-
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
-    def test_convert_validate_only(
-        self, mock_config_class, mock_converter_class, runner, temp_csv_file
+    @pytest.mark.parametrize(
+        "validate_ok,convert_ok,extra_args,expected_exit,expected_sub",
+        [
+            (True, True, [], 0, b"Successfully converted"),
+            (False, True, [], 1, b"Input file validation failed"),
+            (True, False, [], 1, b"Conversion failed"),
+            (True, True, ["--validate-only"], 0, b"Input file is valid"),
+        ],
+    )
+    def test_convert_outcomes(
+        self,
+        mocks,
+        runner,
+        empty_csv_path,
+        mock_converter,
+        mock_config,
+        validate_ok,
+        convert_ok,
+        extra_args,
+        expected_exit,
+        expected_sub,
     ):
-        """Test convert with --validate-only flag."""
-        # Mock configuration
-        mock_config = Mock()
-        mock_config_class.load_from_file.return_value = mock_config
-
-        # Mock converter
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = True
-        mock_converter_class.return_value = mock_converter
+        """Test convert across validation/conversion outcomes and flags."""
+        mocks["Config"].load_from_file.return_value = mock_config
+        mock_converter.validate_csv_file.return_value = validate_ok
+        mock_converter.convert_file.return_value = convert_ok
+        mocks["Trading212Converter"].return_value = mock_converter
 
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
+        with runner.isolated_filesystem():
             result = runner.invoke(
-                cli,
-                ["convert", str(temp_csv_file), output_file.name, "--validate-only"],
+                convert_cmd, [str(empty_csv_path), "out.csv", *extra_args]
             )
 
-        assert result.exit_code == 0
-        assert "Input file is valid" in result.output
+        assert result.exit_code == expected_exit
+        assert expected_sub in result.stdout_bytes
         mock_converter.validate_csv_file.assert_called_once()
-        mock_converter.convert_file.assert_not_called()
+        if extra_args:
+            mock_converter.convert_file.assert_not_called()
+        elif validate_ok:
+            mock_converter.convert_file.assert_called_once()
 
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
     def test_convert_with_custom_config(
         self,
-        mock_config_class,
-        mock_converter_class,
+        mocks,
         runner,
-        temp_csv_file,
+        empty_csv_path,
         temp_config_file,
+        mock_converter,
+        mock_config,
     ):
         """Test convert with custom config file."""
-        # Create a config file
-        config = Config()
-        config.save_to_file(temp_config_file)
-
-        # Mock configuration loading
-        mock_config = Mock()
-        mock_config_class.load_from_file.return_value = mock_config
+        # Only the path needs to exist; load_from_file is mocked.
+        temp_config_file.touch()
 
-        # Mock converter
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = True
-        mock_converter.convert_file.return_value = True
-        mock_converter_class.return_value = mock_converter
+        mocks["Config"].load_from_file.return_value = mock_config
+        mocks["Trading212Converter"].return_value = mock_converter
 
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
+        with runner.isolated_filesystem():
             result = runner.invoke(
-                cli,
-                [
-                    "convert",
-                    str(temp_csv_file),
-                    output_file.name,
-                    "--config",
-                    str(temp_config_file),
-                ],
+                convert_cmd,
+                [str(empty_csv_path), "out.csv", "--config", str(temp_config_file)],
             )
 
         assert result.exit_code == 0
-        mock_config_class.load_from_file.assert_called_with(temp_config_file)
+        mocks["Config"].load_from_file.assert_called_with(temp_config_file)
 
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
     def test_convert_verbose_logging(
-        self, mock_config_class, mock_converter_class, runner, temp_csv_file
+        self,
+        mocks,
+        runner,
+        empty_csv_path,
+        mock_converter,
+        mock_config,
     ):
         """Test convert with verbose logging."""
-        # Mock configuration
-        mock_config = Mock()
-        mock_config_class.load_from_file.return_value = mock_config
+        mocks["Config"].load_from_file.return_value = mock_config
+        mocks["Trading212Converter"].return_value = mock_converter
 
-        # Mock converter
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = True
-        mock_converter.convert_file.return_value = True
-        mock_converter_class.return_value = mock_converter
-
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
+        with runner.isolated_filesystem():
             with patch("trading212_gnucash.cli.setup_logging") as mock_setup_logging:
                 result = runner.invoke(
-                    cli, ["convert", str(temp_csv_file), output_file.name, "--verbose"]
+                    convert_cmd, [str(empty_csv_path), "out.csv", "--verbose"]
                 )
 
         assert result.exit_code == 0
         mock_setup_logging.assert_called_with(True)
 
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
-    def test_convert_exception_handling(
-        self, mock_config_class, mock_converter_class, runner, temp_csv_file
-    ):
-        """Test convert command exception handling."""
-        # Mock configuration to raise exception
-        mock_config_class.load_from_file.side_effect = Exception("Config error")
-
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
-            result = runner.invoke(
-                cli, ["convert", str(temp_csv_file), output_file.name]
-            )
-
-        assert result.exit_code == 1
-        # The error is logged but may not appear in CLI output, so just check exit code
-
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    @patch("trading212_gnucash.cli.Config")
-    def test_convert_exception_verbose(
-        self, mock_config_class, mock_converter_class, runner, temp_csv_file
-    ):
-        """Test convert command exception handling with verbose output."""
+    @pytest.mark.parametrize("verbose", [False, True])
+    def test_convert_exception_handling(self, mocks, runner, empty_csv_path, verbose):
+        """Test convert command exception handling, quiet and verbose."""
         # Mock configuration to raise exception
-        mock_config_class.load_from_file.side_effect = Exception("Config error")
+        mocks["Config"].load_from_file.side_effect = Exception("Config error")
+        args = [str(empty_csv_path), "out.csv"]
+        if verbose:
+            args.append("--verbose")
 
-        with tempfile.NamedTemporaryFile(suffix=".csv") as output_file:
-            with patch(
-                "trading212_gnucash.cli.console.print_exception"
-            ) as mock_print_exc:
-                result = runner.invoke(
-                    cli, ["convert", str(temp_csv_file), output_file.name, "--verbose"]
-                )
+        with runner.isolated_filesystem():
+            with patch.object(cli_module.console, "print_exception") as mock_print_exc:
+                result = runner.invoke(convert_cmd, args)
 
+        # The error is logged but may not appear in CLI output, so just
+        # check the exit code; the traceback is printed only with --verbose.
         assert result.exit_code == 1
-        mock_print_exc.assert_called_once()
+        if verbose:
+            mock_print_exc.assert_called_once()
+        else:
+            mock_print_exc.assert_not_called()
 
 
 class TestInitConfigCommand:
     """Test init-config command functionality."""
 
-    def test_init_config_help(self, runner):
+    def test_init_config_help(self, help_results):
         """Test init-config command help."""
-        result = runner.invoke(cli, ["init-config", "--help"])
-        assert result.exit_code == 0
-        assert "Create a sample configuration file" in result.output
-
-    @patch("trading212_gnucash.cli.create_sample_config")
-    def test_init_config_success(self, mock_create_config, runner, temp_config_file):
-        """Test successful config initialization."""
-        result = runner.invoke(cli, ["init-config", "--config", str(temp_config_file)])
-
+        result = help_results["init-config"]
         assert result.exit_code == 0
-        assert "Sample configuration created" in result.output
-        assert "Next steps:" in result.output
-        mock_create_config.assert_called_once_with(temp_config_file)
-
-    def test_init_config_file_exists_no_force(self, runner, temp_config_file):
-        """Test init-config when file exists without --force."""
-        # Create the file
-        temp_config_file.touch()
-
-        result = runner.invoke(cli, ["init-config", "--config", str(temp_config_file)])
-
-        assert result.exit_code == 0
-        assert "Configuration file already exists" in result.output
-        assert "Use --force to overwrite" in result.output
-
+        assert b"Create a sample configuration file" in result.stdout_bytes
+
+    @pytest.mark.parametrize(
+        "preexist,force,expect_created,expect_sub",
+        [
+            (False, False, True, b"Sample configuration created"),
+            (True, False, False, b"Configuration file already exists"),
+            (True, True, True, b"Sample configuration created"),
+        ],
+    )
     @patch("trading212_gnucash.cli.create_sample_config")
-    def test_init_config_file_exists_with_force(
-        self, mock_create_config, runner, temp_config_file
+    def test_init_config_outcomes(
+        self,
+        mock_create_config,
+        runner,
+        temp_config_file,
+        preexist,
+        force,
+        expect_created,
+        expect_sub,
     ):
-        """Test init-config when file exists with --force."""
-        # Create the file
-        temp_config_file.touch()
+        """Test init-config across pre-existing file and --force combinations."""
+        if preexist:
+            temp_config_file.touch()
+        args = ["--config", str(temp_config_file)]
+        if force:
+            args.append("--force")
 
-        result = runner.invoke(
-            cli, ["init-config", "--config", str(temp_config_file), "--force"]
-        )
+        result = runner.invoke(init_config_cmd, args)
 
         assert result.exit_code == 0
-        assert "Sample configuration created" in result.output
-        mock_create_config.assert_called_once_with(temp_config_file)
+        assert expect_sub in result.stdout_bytes
+        if expect_created:
+            assert b"Next steps:" in result.stdout_bytes
+            mock_create_config.assert_called_once_with(temp_config_file)
+        else:
+            assert b"Use --force to overwrite" in result.stdout_bytes
+            mock_create_config.assert_not_called()
 
     def test_init_config_default_path(self, runner):
         """Test init-config with default path."""
         with patch("trading212_gnucash.cli.create_sample_config") as mock_create_config:
             with patch("pathlib.Path.exists", return_value=False):
-                result = runner.invoke(cli, ["init-config"])
+                result = runner.invoke(init_config_cmd, [])
 
         assert result.exit_code == 0
         mock_create_config.assert_called_once()
@@ -405,188 +377,376 @@ class TestInitConfigCommand:
         """Test init-config exception handling."""
         mock_create_config.side_effect = Exception("Permission denied")
 
-        result = runner.invoke(cli, ["init-config", "--config", str(temp_config_file)])
+        result = runner.invoke(init_config_cmd, ["--config", str(temp_config_file)])
 
         assert result.exit_code == 1
-        assert "Error creating configuration" in result.output
+        assert b"Error creating configuration" in result.stdout_bytes
 
 
 class TestValidateConfigCommand:
     """Test validate-config command functionality."""
 
-    def test_validate_config_help(self, runner):
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """Patch the config entry point in one context."""
+        with patch.multiple("trading212_gnucash.cli", Config=DEFAULT) as mocks:
+            yield mocks
+
+    def test_validate_config_help(self, help_results):
         """Test validate-config command help."""
-        result = runner.invoke(cli, ["validate-config", "--help"])
+        result = help_results["validate-config"]
         assert result.exit_code == 0
-        assert "Validate configuration file" in result.output
+        assert b"Validate configuration file" in result.stdout_bytes
 
-    @patch("trading212_gnucash.cli.Config")
-    def test_validate_config_success_default(self, mock_config_class, runner):
+    def test_validate_config_success_default(self, mocks, runner):
         """Test successful config validation with default config."""
         # Mock config
-        mock_config = Mock()
-        mock_config.ticker_map = {"MSFT": "NASDAQ:MSFT", "AAPL": "NASDAQ:AAPL"}
-        mock_config.deposit_account = "Assets:Trading212"
-        mock_config.interest_account = "Income:Interest"
-        mock_config.expense_accounts = Mock()
-        mock_config.expense_accounts.conversion_fee = "Expenses:Fees"
-        mock_config.expense_accounts.french_tax = "Expenses:Tax:French"
-        mock_config.expense_accounts.stamp_duty_tax = "Expenses:Tax:Stamp"
+        mock_config = SimpleNamespace(
+            ticker_map={"MSFT": "NASDAQ:MSFT", "AAPL": "NASDAQ:AAPL"},
+            deposit_account="Assets:Trading212",
+            interest_account="Income:Interest",
+            expense_accounts=SimpleNamespace(
+                conversion_fee="Expenses:Fees",
+                french_tax="Expenses:Tax:French",
+                stamp_duty_tax="Expenses:Tax:Stamp",
+            ),
+        )
 
-        mock_config_class.load_from_file.return_value = mock_config
+        mocks["Config"].load_from_file.return_value = mock_config
 
-        result = runner.invoke(cli, ["validate-config"])
+        result = runner.invoke(validate_config_cmd, [])
 
         assert result.exit_code == 0
-        assert "Default configuration loaded" in result.output
-        assert "Configuration Summary" in result.output
-        assert "Ticker Mappings" in result.output
+        assert b"Default configuration loaded" in result.stdout_bytes
+        assert b"Configuration Summary" in result.stdout_bytes
+        assert b"Ticker Mappings" in result.stdout_bytes
 
-    @patch("trading212_gnucash.cli.Config")
-    def test_validate_config_success_custom_file(
-        self, mock_config_class, runner, temp_config_file
-    ):
+    def test_validate_config_success_custom_file(self, mocks, runner, temp_config_file):
         """Test successful config validation with custom file."""
-        # Create a real config file
-        config = Config()
-        config.save_to_file(temp_config_file)
+        # Only the path needs to exist; load_from_file is mocked.
+        temp_config_file.touch()
 
         # Mock config
-        mock_config = Mock()
-        mock_config.ticker_map = {"MSFT": "NASDAQ:MSFT"}
-        mock_config.deposit_account = "Assets:Trading212"
-        mock_config.interest_account = "Income:Interest"
-        mock_config.expense_accounts = Mock()
-        mock_config.expense_accounts.conversion_fee = "Expenses:Fees"
-        mock_config.expense_accounts.french_tax = "Expenses:Tax:French"
-        mock_config.expense_accounts.stamp_duty_tax = "Expenses:Tax:Stamp"
-
-        mock_config_class.load_from_file.return_value = mock_config
-
-        result = runner.invoke(
-            cli, ["validate-config", "--config", str(temp_config_file)]
+        mock_config = SimpleNamespace(
+            ticker_map={"MSFT": "NASDAQ:MSFT"},
+            deposit_account="Assets:Trading212",
+            interest_account="Income:Interest",
+            expense_accounts=SimpleNamespace(
+                conversion_fee="Expenses:Fees",
+                french_tax="Expenses:Tax:French",
+                stamp_duty_tax="Expenses:Tax:Stamp",
+            ),
         )
 
+        mocks["Config"].load_from_file.return_value = mock_config
+
+        result = runner.invoke(validate_config_cmd, ["--config", str(temp_config_file)])
+
         assert result.exit_code == 0
-        assert f"Configuration file is valid: {temp_config_file}" in result.output
+        # The console may wrap the long tmp_path onto the next line.
+        output = result.output.replace("\n", "")
+        assert f"Configuration file is valid: {temp_config_file}" in output
 
-    @patch("trading212_gnucash.cli.Config")
-    def test_validate_config_empty_ticker_map(self, mock_config_class, runner):
+    def test_validate_config_empty_ticker_map(self, mocks, runner):
         """Test config validation with empty ticker map."""
         # Mock config with empty ticker map
-        mock_config = Mock()
-        mock_config.ticker_map = {}
-        mock_config.deposit_account = "Assets:Trading212"
-        mock_config.interest_account = "Income:Interest"
-        mock_config.expense_accounts = Mock()
-        mock_config.expense_accounts.conversion_fee = "Expenses:Fees"
-        mock_config.expense_accounts.french_tax = "Expenses:Tax:French"
-        mock_config.expense_accounts.stamp_duty_tax = "Expenses:Tax:Stamp"
+        mock_config = SimpleNamespace(
+            ticker_map={},
+            deposit_account="Assets:Trading212",
+            interest_account="Income:Interest",
+            expense_accounts=SimpleNamespace(
+                conversion_fee="Expenses:Fees",
+                french_tax="Expenses:Tax:French",
+                stamp_duty_tax="Expenses:Tax:Stamp",
+            ),
+        )
 
-        mock_config_class.load_from_file.return_value = mock_config
+        mocks["Config"].load_from_file.return_value = mock_config
 
-        result = runner.invoke(cli, ["validate-config"])
+        result = runner.invoke(validate_config_cmd, [])
 
         assert result.exit_code == 0
-        assert "Default configuration loaded" in result.output
+        assert b"Default configuration loaded" in result.stdout_bytes
         # Should not show ticker mappings table when empty
-        assert "Ticker Mappings" not in result.output or "MSFT" not in result.output
+        assert (
+            b"Ticker Mappings" not in result.stdout_bytes
+            or b"MSFT" not in result.stdout_bytes
+        )
 
-    @patch("trading212_gnucash.cli.Config")
-    def test_validate_config_exception_handling(self, mock_config_class, runner):
+    def test_validate_config_exception_handling(self, mocks, runner):
         """Test validate-config exception handling."""
-        mock_config_class.load_from_file.side_effect = Exception("Invalid config")
+        mocks["Config"].load_from_file.side_effect = Exception("Invalid config")
 
-        result = runner.invoke(cli, ["validate-config"])
+        result = runner.invoke(validate_config_cmd, [])
 
         assert result.exit_code == 1
-        assert "Configuration error" in result.output
+        assert b"Configuration error" in result.stdout_bytes
+
+
+def _make_polars_stub():
+    """Minimal polars stand-in for _summarize_with_polars.
+
+    Implements just the lazy-frame surface the fast path touches,
+    evaluated eagerly with csv and Counter so its results can be checked
+    against the streaming pass without polars installed.
+    """
+
+    class Expr:
+        def __init__(self, op, column=None):
+            self.op = op
+            self.column = column
+            self.name = op
+
+        def alias(self, name):
+            self.name = name
+            return self
+
+        def drop_nulls(self):
+            return self
+
+        def min(self):
+            self.op = "min"
+            return self
+
+        def max(self):
+            self.op = "max"
+            return self
+
+        def n_unique(self):
+            self.op = "n_unique"
+            return self
+
+    class Frame:
+        def __init__(self, columns, rows):
+            self._columns = columns
+            self._rows = rows
+
+        def __getitem__(self, name):
+            i = self._columns.index(name)
+            return [row[i] for row in self._rows]
+
+        def iter_rows(self):
+            return iter(self._rows)
+
+    class Collected:
+        def __init__(self, frame):
+            self._frame = frame
+
+        def collect(self):
+            return self._frame
+
+    class Grouped:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def agg(self, expr):
+            return self
+
+        def sort(self, column, descending=False):
+            self._rows = sorted(self._rows, key=lambda r: r[1], reverse=descending)
+            return self
+
+        def head(self, n):
+            self._rows = self._rows[:n]
+            return self
+
+        def collect(self):
+            return Frame(("name", "count"), self._rows)
+
+    class LazyFrame:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def select(self, *exprs):
+            values = []
+            for expr in exprs:
+                if expr.op == "len":
+                    values.append(len(self._rows))
+                    continue
+                column = [
+                    r[expr.column] for r in self._rows if r[expr.column] is not None
+                ]
+                if expr.op == "min":
+                    values.append(min(column, default=None))
+                elif expr.op == "max":
+                    values.append(max(column, default=None))
+                else:  # n_unique
+                    values.append(len(set(column)))
+            return Collected(Frame([e.name for e in exprs], [tuple(values)]))
+
+        def drop_nulls(self, column):
+            return LazyFrame([r for r in self._rows if r[column] is not None])
+
+        def group_by(self, column):
+            return Grouped(list(Counter(r[column] for r in self._rows).items()))
+
+    def scan_csv(path, infer_schema_length=None):
+        # Like polars' CSV reader, empty fields become null
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = [
+                {k: (v or None) for k, v in row.items()} for row in csv.DictReader(f)
+            ]
+        return LazyFrame(rows)
+
+    stub = ModuleType("polars")
+    stub.scan_csv = scan_csv
+    stub.len = lambda: Expr("len")
+    stub.col = lambda name: Expr("col", name)
+    return stub
 
 
 class TestInfoCommand:
     """Test info command functionality."""
 
-    def test_info_help(self, runner):
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """Patch the converter entry point in one context."""
+        with patch.multiple(
+            "trading212_gnucash.cli", Trading212Converter=DEFAULT
+        ) as mocks:
+            yield mocks
+
+    def test_info_help(self, help_results):
         """Test info command help."""
-        result = runner.invoke(cli, ["info", "--help"])
+        result = help_results["info"]
         assert result.exit_code == 0
-        assert "Display information about a Trading 212 CSV file" in result.output
+        assert (
+            b"Display information about a Trading 212 CSV file" in result.stdout_bytes
+        )
 
     def test_info_missing_file(self, runner):
         """Test info with non-existent file."""
-        result = runner.invoke(cli, ["info", "nonexistent.csv"])
+        result = runner.invoke(info_cmd, ["nonexistent.csv"])
         assert result.exit_code == 2
         assert "does not exist" in result.output
 
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    def test_info_invalid_csv(self, mock_converter_class, runner, temp_csv_file):
+    def test_info_invalid_csv(self, mocks, runner, empty_csv_path, mock_converter):
         """Test info with invalid CSV file."""
-        mock_converter = Mock()
         mock_converter.validate_csv_file.return_value = False
-        mock_converter_class.return_value = mock_converter
+        mocks["Trading212Converter"].return_value = mock_converter
 
-        result = runner.invoke(cli, ["info", str(temp_csv_file)])
+        result = runner.invoke(info_cmd, [str(empty_csv_path)])
 
         assert result.exit_code == 1
-        assert "Invalid CSV file" in result.output
+        assert b"Invalid CSV file" in result.stdout_bytes
 
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    def test_info_empty_file(self, mock_converter_class, runner, temp_csv_file):
+    def test_info_empty_file(self, mocks, runner, empty_csv_path, mock_converter):
         """Test info with empty CSV file."""
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = True
         mock_converter.read_transactions.return_value = []
-        mock_converter_class.return_value = mock_converter
+        mocks["Trading212Converter"].return_value = mock_converter
 
-        result = runner.invoke(cli, ["info", str(temp_csv_file)])
+        result = runner.invoke(info_cmd, [str(empty_csv_path)])
 
         assert result.exit_code == 0
-        assert "No transactions found" in result.output
+        assert b"No transactions found" in result.stdout_bytes
 
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    def test_info_success(self, mock_converter_class, runner, temp_csv_file):
+    def test_info_success(self, mocks, runner, empty_csv_path, mock_converter):
         """Test successful info command."""
-        # Mock transactions
-        mock_transaction1 = Mock()
-        mock_transaction1.action = "Market buy"
-        mock_transaction1.ticker = "MSFT"
-        mock_transaction1.time = "2025-01-01 10:00:00.000"
-
-        mock_transaction2 = Mock()
-        mock_transaction2.action = "Deposit"
-        mock_transaction2.ticker = None
-        mock_transaction2.time = "2025-01-01 09:00:00.000"
-
-        mock_transaction3 = Mock()
-        mock_transaction3.action = "Market buy"
-        mock_transaction3.ticker = "AAPL"
-        mock_transaction3.time = "2025-01-02 10:00:00.000"
-
-        mock_converter = Mock()
-        mock_converter.validate_csv_file.return_value = True
+        # Stand-in transactions; the command only reads these attributes
+        mock_transaction1 = SimpleNamespace(
+            action="Market buy", ticker="MSFT", time="2025-01-01 10:00:00.000"
+        )
+        mock_transaction2 = SimpleNamespace(
+            action="Deposit", ticker=None, time="2025-01-01 09:00:00.000"
+        )
+        mock_transaction3 = SimpleNamespace(
+            action="Market buy", ticker="AAPL", time="2025-01-02 10:00:00.000"
+        )
+
         mock_converter.read_transactions.return_value = [
             mock_transaction1,
             mock_transaction2,
             mock_transaction3,
         ]
-        mock_converter_class.return_value = mock_converter
+        mocks["Trading212Converter"].return_value = mock_converter
 
-        result = runner.invoke(cli, ["info", str(temp_csv_file)])
+        result = runner.invoke(info_cmd, [str(empty_csv_path)])
 
         assert result.exit_code == 0
-        assert "File Summary" in result.output
-        assert "Total Transactions" in result.output
-        assert "3" in result.output  # Total transactions
-        assert "Transaction Types" in result.output
-        assert "Top Tickers" in result.output
-        assert "Date Range" in result.output
-
-    @patch("trading212_gnucash.cli.Trading212Converter")
-    def test_info_exception_handling(self, mock_converter_class, runner, temp_csv_file):
+        assert b"File Summary" in result.stdout_bytes
+        assert b"Total Transactions" in result.stdout_bytes
+        assert b"3" in result.stdout_bytes  # Total transactions
+        assert b"Transaction Types" in result.stdout_bytes
+        assert b"Top Tickers" in result.stdout_bytes
+        assert b"Date Range" in result.stdout_bytes
+
+    def test_summarize_with_polars_fallback(self, empty_csv_path):
+        """Small files fall back to the row-by-row pass (None result).
+
+        Also covers the polars-not-installed case, which returns None
+        before the size check.
+        """
+        assert cli_module._summarize_with_polars(empty_csv_path) is None
+
+    def test_summarize_with_polars_matches_streaming_pass(self, tmp_path, monkeypatch):
+        """The vectorized summary agrees with the row-by-row pass."""
+        monkeypatch.setitem(sys.modules, "polars", _make_polars_stub())
+
+        # A file over the size threshold so the fast path engages; rows
+        # cycle through trading and cash actions, with the cash rows
+        # leaving Ticker empty
+        input_file = tmp_path / "large.csv"
+        cycle = [
+            ("Market buy", "MSFT"),
+            ("Market sell", "AAPL"),
+            ("Deposit", ""),
+            ("Interest on cash", ""),
+        ]
+        padding = "x" * 120
+        with open(input_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "Action",
+                    "Time",
+                    "ISIN",
+                    "Ticker",
+                    "Name",
+                    "Notes",
+                    "ID",
+                    "Total",
+                    "Currency (Total)",
+                ]
+            )
+            for i in range(8000):
+                action, ticker = cycle[i % len(cycle)]
+                writer.writerow(
+                    [
+                        action,
+                        f"2025-01-01 00:00:00.{i:06d}",
+                        "",
+                        ticker,
+                        "",
+                        padding,
+                        str(i + 1),
+                        "10.00",
+                        "GBP",
+                    ]
+                )
+        assert input_file.stat().st_size > cli_module._POLARS_THRESHOLD
+
+        # The row-by-row pass the info command falls back to
+        transactions = list(Trading212Converter().read_transactions(input_file))
+        times = [t.time for t in transactions]
+        expected_actions = Counter(t.action for t in transactions)
+        expected_tickers = Counter(t.ticker for t in transactions if t.ticker)
+
+        result = cli_module._summarize_with_polars(input_file)
+        assert result is not None
+        total, min_time, max_time, unique_tickers, action_rows, ticker_rows = result
+
+        assert total == len(transactions)
+        assert min_time == min(times)
+        assert max_time == max(times)
+        assert unique_tickers == len(expected_tickers)
+        assert dict(action_rows) == dict(expected_actions)
+        assert dict(ticker_rows) == dict(expected_tickers)
+
+    def test_info_exception_handling(self, mocks, runner, empty_csv_path):
         """Test info command exception handling."""
-        mock_converter_class.side_effect = Exception("Converter error")
+        mocks["Trading212Converter"].side_effect = Exception("Converter error")
 
-        result = runner.invoke(cli, ["info", str(temp_csv_file)])
+        result = runner.invoke(info_cmd, [str(empty_csv_path)])
 
         assert result.exit_code == 1
-        assert "Error analyzing file" in result.output
+        assert b"Error analyzing file" in result.stdout_bytes
@@ -16,57 +16,79 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import json
 import os
-import tempfile
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
 
-from trading212_gnucash.config import Config, ExpenseAccounts, create_sample_config
+from trading212_gnucash import config as config_module
+from trading212_gnucash.config import (
+    Config,
+    ExpenseAccounts,
+    create_sample_config,
+    set_cache_enabled,
+)
+
+# libyaml-backed loader/dumper when available, matching the config module
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 @pytest.fixture
-def temp_config_file():
-    """Create a temporary config file path."""
-    with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-        temp_path = Path(f.name)
+def clean_env(monkeypatch):
+    """Empty environment restored via monkeypatch's delta tracking.
 
-    # Remove the file so tests can create it
-    temp_path.unlink()
+    Cheaper than patch.dict(os.environ, ..., clear=True), which snapshots
+    and restores the whole environment around every test.
+    """
+    for key in list(os.environ):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture
+def temp_config_file(tmp_path):
+    """Path for a config file that does not yet exist."""
+    return tmp_path / "config.yaml"
+
+
+# Sample configuration data for testing; treated as read-only
+SAMPLE_CONFIG_DATA = {
+    "ticker_map": {
+        "MSFT": "NASDAQ:MSFT",
+        "AAPL": "NASDAQ:AAPL",
+        "TEST": "TEST.L",
+    },
+    "deposit_account": "Assets:Test:Deposits",
+    "interest_account": "Income:Test:Interest",
+    "expense_accounts": {
+        "conversion_fee": "Expenses:Test:Conversion",
+        "french_tax": "Expenses:Test:French",
+        "stamp_duty_tax": "Expenses:Test:Stamp",
+    },
+}
 
 
 @pytest.fixture
 def sample_config_data():
     """Sample configuration data for testing."""
-    return {
-        "ticker_map": {
-            "MSFT": "NASDAQ:MSFT",
-            "AAPL": "NASDAQ:AAPL",
-            "TEST": "TEST.L",
-        },
-        "deposit_account": "Assets:Test:Deposits",
-        "interest_account": "Income:Test:Interest",
-        "expense_accounts": {
-            "conversion_fee": "Expenses:Test:Conversion",
-            "french_tax": "Expenses:Test:French",
-            "stamp_duty_tax": "Expenses:Test:Stamp",
-        },
-    }
+    return SAMPLE_CONFIG_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_yaml_bytes():
+    """Serialize the sample config once per session."""
+    return yaml.dump(SAMPLE_CONFIG_DATA, Dumper=_YAML_DUMPER).encode("utf-8")
 
 
 @pytest.fixture
-def sample_yaml_config(temp_config_file, sample_config_data):
-    """Create a sample YAML config file."""
-    with open(temp_config_file, "w", encoding="utf-8") as f:
-        yaml.dump(sample_config_data, f)
+def sample_yaml_config(temp_config_file, sample_yaml_bytes):
+    """Create a sample YAML config file from the pre-serialized blob."""
+    temp_config_file.write_bytes(sample_yaml_bytes)
     return temp_config_file
 
 
@@ -207,7 +229,7 @@ class TestConfigLoadFromFile:
         """Test loading file with invalid config data."""
         invalid_data = {"ticker_map": "not_a_dict"}  # Should be dict
         with open(temp_config_file, "w", encoding="utf-8") as f:
-            yaml.dump(invalid_data, f)
+            yaml.dump(invalid_data, f, Dumper=_YAML_DUMPER)
 
         with pytest.raises(ValueError, match="Error loading config file"):
             Config.load_from_file(temp_config_file)
@@ -220,59 +242,139 @@ class TestConfigLoadFromFile:
             # Should return default config
             assert "MSFT" in config.ticker_map
 
+    @pytest.mark.xdist_group("default-config-paths")
     def test_load_from_file_none_path_with_defaults(self, sample_yaml_config):
-        """Test loading with None path when default files exist."""
+        """Test loading with None path when default files exist.
+
+        Grouped with the default-path search test below: both touch real
+        default config locations shared across pytest-xdist workers.
+        """
         # Create a mock path that exists and points to our test file
         mock_path = Path("~/.config/trading212-gnucash/config.yaml").expanduser()
 
-        # Copy our test file to the expected location
+        # Copy our test file to the expected location; copyfile keeps the
+        # copy in the kernel rather than round-tripping through Python
+        created_parent = not mock_path.parent.exists()
         mock_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(sample_yaml_config, encoding="utf-8") as src:
-            with open(mock_path, "w", encoding="utf-8") as dst:
-                dst.write(src.read())
+        shutil.copyfile(sample_yaml_config, mock_path)
 
         try:
             config = Config.load_from_file(None)
             assert config.ticker_map["MSFT"] == "NASDAQ:MSFT"
         finally:
-            # Cleanup
+            # Cleanup, including the cache file load_from_file may write
             if mock_path.exists():
                 mock_path.unlink()
-            if mock_path.parent.exists() and not any(mock_path.parent.iterdir()):
+            cache_path = mock_path.with_name(mock_path.name + ".cache.json")
+            if cache_path.exists():
+                cache_path.unlink()
+            if created_parent and not any(mock_path.parent.iterdir()):
                 mock_path.parent.rmdir()
 
+    @pytest.mark.xdist_group("default-config-paths")
     def test_load_from_file_searches_default_paths(self):
-        """Test that load_from_file searches default paths in order."""
+        """Test that load_from_file searches default paths in order.
+
+        Serialized with the test above: a config file left at the
+        home-path candidate would take priority over the current-directory
+        one created here.
+        """
         # Create a temporary config file in current directory (third default path)
         temp_config = Path("trading212_config.yaml")
         config_data = {"ticker_map": {"TEST": "TEST.L"}}
 
         with open(temp_config, "w", encoding="utf-8") as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=_YAML_DUMPER)
 
         try:
             config = Config.load_from_file(None)
             # Should find our config file and load it
             assert config.ticker_map["TEST"] == "TEST.L"
         finally:
-            # Cleanup
+            # Cleanup, including the cache file load_from_file may write
             if temp_config.exists():
                 temp_config.unlink()
+            cache_path = temp_config.with_name(temp_config.name + ".cache.json")
+            if cache_path.exists():
+                cache_path.unlink()
+
+
+class TestConfigCache:
+    """Test the on-disk JSON cache around Config.load_from_file."""
+
+    @staticmethod
+    def _cache_path(config_path):
+        return config_path.with_name(config_path.name + ".cache.json")
+
+    def test_second_load_hits_cache(self, sample_yaml_config, monkeypatch):
+        """A second load of an unchanged file is served from the cache."""
+        first = Config.load_from_file(sample_yaml_config)
+        assert self._cache_path(sample_yaml_config).exists()
+
+        def fail_parse(*args):
+            raise AssertionError("YAML parsed despite a current cache")
+
+        monkeypatch.setattr(config_module, "_parse_yaml_cached", fail_parse)
+        second = Config.load_from_file(sample_yaml_config)
+        assert second == first
+
+    def test_modified_yaml_invalidates_cache(self, sample_yaml_config):
+        """Rewriting the YAML file invalidates the cached entry."""
+        config = Config.load_from_file(sample_yaml_config)
+        assert config.deposit_account == "Assets:Test:Deposits"
+
+        updated = dict(SAMPLE_CONFIG_DATA, deposit_account="Assets:Updated:Deposits")
+        sample_yaml_config.write_bytes(
+            yaml.dump(updated, Dumper=_YAML_DUMPER).encode("utf-8")
+        )
+
+        config = Config.load_from_file(sample_yaml_config)
+        assert config.deposit_account == "Assets:Updated:Deposits"
+
+    def test_corrupt_cache_falls_back_to_yaml(self, sample_yaml_config):
+        """A corrupt cache body is ignored and the YAML file reloaded."""
+        Config.load_from_file(sample_yaml_config)
+        cache_path = self._cache_path(sample_yaml_config)
+        cache_key = cache_path.read_text(encoding="utf-8").splitlines()[0]
+        cache_path.write_text(cache_key + "\nnot json{", encoding="utf-8")
+
+        config = Config.load_from_file(sample_yaml_config)
+        assert config.ticker_map["MSFT"] == "NASDAQ:MSFT"
+
+    def test_no_cache_bypasses_cache(self, sample_yaml_config):
+        """With caching disabled, even a current cache file is ignored."""
+        config = Config.load_from_file(sample_yaml_config)
+        cache_path = self._cache_path(sample_yaml_config)
+        cache_key = cache_path.read_text(encoding="utf-8").splitlines()[0]
+        poisoned = dict(config.model_dump(), deposit_account="Assets:Poisoned")
+        cache_path.write_text(cache_key + "\n" + json.dumps(poisoned), encoding="utf-8")
+
+        set_cache_enabled(False)
+        try:
+            fresh = Config.load_from_file(sample_yaml_config)
+        finally:
+            set_cache_enabled(True)
+
+        assert fresh.deposit_account == "Assets:Test:Deposits"
 
 
+@pytest.mark.xdist_group("env")
 class TestConfigLoadFromEnv:
-    """Test Config.load_from_env method."""
+    """Test Config.load_from_env method.
 
-    def test_load_from_env_empty(self):
+    Grouped onto one pytest-xdist worker so the clean_env manipulation
+    stays serialized under pytest -n auto.
+    """
+
+    def test_load_from_env_empty(self, clean_env):
         """Test loading from environment with no relevant variables."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config.load_from_env()
+        config = Config.load_from_env()
 
-            # Should return default config
-            assert "MSFT" in config.ticker_map
-            assert config.deposit_account == "Assets:Trading 212 Deposits"
+        # Should return default config
+        assert "MSFT" in config.ticker_map
+        assert config.deposit_account == "Assets:Trading 212 Deposits"
 
-    def test_load_from_env_ticker_mappings(self):
+    def test_load_from_env_ticker_mappings(self, clean_env):
         """Test loading ticker mappings from environment."""
         env_vars = {
             "TRADING212_TICKER_MSFT": "NASDAQ:MSFT",
@@ -280,27 +382,31 @@ class TestConfigLoadFromEnv:
             "TRADING212_TICKER_TEST": "TEST.L",
         }
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = Config.load_from_env()
+        for key, value in env_vars.items():
+            clean_env.setenv(key, value)
 
-            assert config.ticker_map["MSFT"] == "NASDAQ:MSFT"
-            assert config.ticker_map["AAPL"] == "NASDAQ:AAPL"
-            assert config.ticker_map["TEST"] == "TEST.L"
+        config = Config.load_from_env()
 
-    def test_load_from_env_account_settings(self):
+        assert config.ticker_map["MSFT"] == "NASDAQ:MSFT"
+        assert config.ticker_map["AAPL"] == "NASDAQ:AAPL"
+        assert config.ticker_map["TEST"] == "TEST.L"
+
+    def test_load_from_env_account_settings(self, clean_env):
         """Test loading account settings from environment."""
         env_vars = {
             "TRADING212_DEPOSIT_ACCOUNT": "Assets:Env:Deposits",
             "TRADING212_INTEREST_ACCOUNT": "Income:Env:Interest",
         }
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = Config.load_from_env()
+        for key, value in env_vars.items():
+            clean_env.setenv(key, value)
 
-            assert config.deposit_account == "Assets:Env:Deposits"
-            assert config.interest_account == "Income:Env:Interest"
+        config = Config.load_from_env()
 
-    def test_load_from_env_expense_accounts(self):
+        assert config.deposit_account == "Assets:Env:Deposits"
+        assert config.interest_account == "Income:Env:Interest"
+
+    def test_load_from_env_expense_accounts(self, clean_env):
         """Test loading expense accounts from environment."""
         env_vars = {
             "TRADING212_CONVERSION_FEE_ACCOUNT": "Expenses:Env:Conversion",
@@ -308,34 +414,35 @@ class TestConfigLoadFromEnv:
             "TRADING212_STAMP_DUTY_ACCOUNT": "Expenses:Env:Stamp",
         }
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = Config.load_from_env()
+        for key, value in env_vars.items():
+            clean_env.setenv(key, value)
+
+        config = Config.load_from_env()
 
-            assert config.expense_accounts.conversion_fee == "Expenses:Env:Conversion"
-            assert config.expense_accounts.french_tax == "Expenses:Env:French"
-            assert config.expense_accounts.stamp_duty_tax == "Expenses:Env:Stamp"
+        assert config.expense_accounts.conversion_fee == "Expenses:Env:Conversion"
+        assert config.expense_accounts.french_tax == "Expenses:Env:French"
+        assert config.expense_accounts.stamp_duty_tax == "Expenses:Env:Stamp"
 
-    def test_load_from_env_partial_expense_accounts(self):
+    def test_load_from_env_partial_expense_accounts(self, clean_env):
         """Test loading partial expense accounts from environment."""
         env_vars = {
             "TRADING212_CONVERSION_FEE_ACCOUNT": "Expenses:Env:Conversion",
             # Only one expense account set
         }
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = Config.load_from_env()
+        for key, value in env_vars.items():
+            clean_env.setenv(key, value)
 
-            assert config.expense_accounts.conversion_fee == "Expenses:Env:Conversion"
-            # Others should use defaults
-            assert (
-                config.expense_accounts.french_tax == "Expenses:French Transaction Tax"
-            )
-            assert (
-                config.expense_accounts.stamp_duty_tax
-                == "Expenses:Stamp Duty Reserve Tax"
-            )
+        config = Config.load_from_env()
 
-    def test_load_from_env_mixed_settings(self):
+        assert config.expense_accounts.conversion_fee == "Expenses:Env:Conversion"
+        # Others should use defaults
+        assert config.expense_accounts.french_tax == "Expenses:French Transaction Tax"
+        assert (
+            config.expense_accounts.stamp_duty_tax == "Expenses:Stamp Duty Reserve Tax"
+        )
+
+    def test_load_from_env_mixed_settings(self, clean_env):
         """Test loading mixed settings from environment."""
         env_vars = {
             "TRADING212_TICKER_MSFT": "NASDAQ:MSFT",
@@ -344,12 +451,14 @@ class TestConfigLoadFromEnv:
             "OTHER_VAR": "should_be_ignored",
         }
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = Config.load_from_env()
+        for key, value in env_vars.items():
+            clean_env.setenv(key, value)
 
-            assert config.ticker_map["MSFT"] == "NASDAQ:MSFT"
-            assert config.deposit_account == "Assets:Env:Deposits"
-            assert config.expense_accounts.conversion_fee == "Expenses:Env:Conversion"
+        config = Config.load_from_env()
+
+        assert config.ticker_map["MSFT"] == "NASDAQ:MSFT"
+        assert config.deposit_account == "Assets:Env:Deposits"
+        assert config.expense_accounts.conversion_fee == "Expenses:Env:Conversion"
 
 
 class TestConfigSaveToFile:
@@ -368,21 +477,20 @@ class TestConfigSaveToFile:
 
         # Load and verify content
         with open(temp_config_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
 
         assert data["ticker_map"]["TEST"] == "TEST.L"
         assert data["deposit_account"] == "Assets:Test:Deposits"
 
-    def test_save_to_file_creates_directory(self):
+    def test_save_to_file_creates_directory(self, tmp_path):
         """Test that save_to_file creates parent directories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "subdir" / "config.yaml"
+        config_path = tmp_path / "subdir" / "config.yaml"
 
-            config = Config()
-            config.save_to_file(config_path)
+        config = Config()
+        config.save_to_file(config_path)
 
-            assert config_path.exists()
-            assert config_path.parent.exists()
+        assert config_path.exists()
+        assert config_path.parent.exists()
 
     def test_save_to_file_with_string_path(self, temp_config_file):
         """Test save to file with string path."""
@@ -483,17 +591,26 @@ class TestConfigHelperMethods:
         assert config.get_tax_account("unknown") == "Custom:French"
 
 
+@pytest.fixture(scope="class")
+def sample_created_config(tmp_path_factory):
+    """Run create_sample_config once for the read-only assertions.
+
+    Returns (path, file content, loaded Config); the TestCreateSampleConfig
+    tests only inspect these, so one generation serves them all.
+    """
+    path = tmp_path_factory.mktemp("sample") / "config.yaml"
+    create_sample_config(path)
+    return path, path.read_text(encoding="utf-8"), Config.load_from_file(path)
+
+
 class TestCreateSampleConfig:
     """Test create_sample_config function."""
 
-    def test_create_sample_config_basic(self, temp_config_file):
+    def test_create_sample_config_basic(self, sample_created_config):
         """Test basic sample config creation."""
-        create_sample_config(temp_config_file)
-
-        assert temp_config_file.exists()
+        path, _, config = sample_created_config
 
-        # Check that it's a valid config
-        config = Config.load_from_file(temp_config_file)
+        assert path.exists()
 
         # Should have default values plus examples
         assert "MSFT" in config.ticker_map  # Default
@@ -507,43 +624,48 @@ class TestCreateSampleConfig:
 
         assert temp_config_file.exists()
 
-    def test_create_sample_config_creates_directory(self):
+    def test_create_sample_config_creates_directory(self, tmp_path):
         """Test that create_sample_config creates parent directories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "subdir" / "config.yaml"
+        config_path = tmp_path / "subdir" / "config.yaml"
 
-            create_sample_config(config_path)
+        create_sample_config(config_path)
 
-            assert config_path.exists()
-            assert config_path.parent.exists()
+        assert config_path.exists()
+        assert config_path.parent.exists()
 
-    def test_create_sample_config_has_comments(self, temp_config_file):
+    def test_create_sample_config_has_comments(self, sample_created_config):
         """Test that sample config includes helpful comments."""
-        create_sample_config(temp_config_file)
-
-        with open(temp_config_file, encoding="utf-8") as f:
-            content = f.read()
+        _, content, _ = sample_created_config
 
         assert "Trading 212 to GnuCash" in content
         assert "ticker_map:" in content
         assert "Configuration Notes:" in content
         assert "expense_accounts:" in content
 
-    def test_create_sample_config_valid_yaml(self, temp_config_file):
+    def test_create_sample_config_valid_yaml(self, sample_created_config):
         """Test that created sample config is valid YAML."""
-        create_sample_config(temp_config_file)
-
-        # Should be able to load without errors
-        config = Config.load_from_file(temp_config_file)
+        # The fixture already loaded it without errors
+        _, _, config = sample_created_config
 
         assert isinstance(config.ticker_map, dict)
         assert len(config.ticker_map) > 5  # Should have defaults plus examples
 
-    def test_create_sample_config_example_tickers(self, temp_config_file):
-        """Test that sample config includes example tickers."""
-        create_sample_config(temp_config_file)
+    def test_create_sample_config_matches_defaults(self, sample_created_config):
+        """The pre-rendered template must not drift from the Config defaults."""
+        _, _, config = sample_created_config
 
-        config = Config.load_from_file(temp_config_file)
+        expected = Config()
+        assert config.ticker_map == {
+            **expected.ticker_map,
+            **config_module._SAMPLE_TICKER_EXAMPLES,
+        }
+        assert config.deposit_account == expected.deposit_account
+        assert config.interest_account == expected.interest_account
+        assert config.expense_accounts == expected.expense_accounts
+
+    def test_create_sample_config_example_tickers(self, sample_created_config):
+        """Test that sample config includes example tickers."""
+        _, _, config = sample_created_config
 
         # Check for example tickers that should be added
         example_tickers = ["TSLA", "AMZN", "NFLX", "META", "NVDA", "FAKE"]
@@ -592,7 +714,7 @@ class TestConfigIntegration:
             == original_config.expense_accounts.stamp_duty_tax
         )
 
-    def test_env_vs_file_precedence(self, sample_yaml_config):
+    def test_env_vs_file_precedence(self, sample_yaml_config, clean_env):
         """Test that environment variables work independently of file config."""
         # Load from file
         file_config = Config.load_from_file(sample_yaml_config)
@@ -603,8 +725,10 @@ class TestConfigIntegration:
             "TRADING212_DEPOSIT_ACCOUNT": "Assets:Env:Deposits",
         }
 
-        with patch.dict(os.environ, env_vars, clear=True):
-            env_config = Config.load_from_env()
+        for key, value in env_vars.items():
+            clean_env.setenv(key, value)
+
+        env_config = Config.load_from_env()
 
         # They should be different
         assert file_config.ticker_map["MSFT"] != env_config.ticker_map["MSFT"]
@@ -17,8 +17,10 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import csv
-import tempfile
+import io
+from dataclasses import replace
 from decimal import Decimal
+from itertools import islice
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -31,28 +33,87 @@ from trading212_gnucash.models import (
     Trading212Transaction,
 )
 
-
-@pytest.fixture
+# Transactions shared across conversion tests, built once at import time
+# so the Decimal parsing and dataclass construction don't rerun per test.
+# Tests needing a variant take a copy via dataclasses.replace.
+SAMPLE_TRANSACTIONS = {
+    "deposit": Trading212Transaction(
+        action="Deposit",
+        time="2025-01-01 09:00:00.000",
+        id="54321",
+        total=Decimal("1000.00"),
+        total_currency="GBP",
+    ),
+    "interest": Trading212Transaction(
+        action="Interest on cash",
+        time="2025-01-15 12:00:00.000",
+        id="54322",
+        total=Decimal("5.50"),
+        total_currency="GBP",
+    ),
+    "market_buy": Trading212Transaction(
+        action="Market buy",
+        time="2025-01-01 10:00:00.000",
+        isin="US5949181045",
+        ticker="MSFT",
+        name="Microsoft Corporation",
+        id="12345",
+        num_shares=Decimal("10.5"),
+        price_per_share=Decimal("150.00"),
+        price_currency="USD",
+        exchange_rate=Decimal("0.8"),
+        result_currency="GBP",
+        total=Decimal("-1260.00"),
+        total_currency="GBP",
+    ),
+    "market_sell": Trading212Transaction(
+        action="Market sell",
+        time="2025-01-02 11:00:00.000",
+        isin="US0378331005",
+        ticker="AAPL",
+        name="Apple Inc.",
+        id="12346",
+        num_shares=Decimal("5.0"),
+        price_per_share=Decimal("180.00"),
+        price_currency="USD",
+        exchange_rate=Decimal("0.85"),
+        result_currency="GBP",
+        total=Decimal("765.00"),
+        total_currency="GBP",
+    ),
+}
+
+
+@pytest.fixture(scope="module")
 def sample_config():
-    """Sample configuration for testing."""
-    config = Config()
-    config.ticker_map = {
-        "MSFT": "NASDAQ:MSFT",
-        "AAPL": "NASDAQ:AAPL",
-        "VOD": "VOD.L",
-    }
-    config.deposit_account = "Assets:Trading212:Cash"
-    config.interest_account = "Income:Trading212:Interest"
-    return config
-
-
-@pytest.fixture
+    """Sample configuration for testing.
+
+    Module-scoped: Config is frozen, so sharing one instance across
+    tests is safe and skips per-test model construction.
+    """
+    return Config(
+        ticker_map={
+            "MSFT": "NASDAQ:MSFT",
+            "AAPL": "NASDAQ:AAPL",
+            "VOD": "VOD.L",
+        },
+        deposit_account="Assets:Trading212:Cash",
+        interest_account="Income:Trading212:Interest",
+    )
+
+
+@pytest.fixture(scope="module")
 def converter(sample_config):
-    """Converter instance with sample config."""
+    """Converter instance with sample config.
+
+    Module-scoped: the converter holds no per-test state (every call
+    takes the transaction or file as an argument), so one instance
+    serves the whole module.
+    """
     return Trading212Converter(sample_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_csv_headers():
     """Valid CSV headers for Trading 212 export."""
     return [
@@ -73,76 +134,87 @@ def valid_csv_headers():
     ]
 
 
-@pytest.fixture
-def sample_csv_content():
-    """Sample Trading 212 CSV content with various transaction types."""
-    return """Action,Time,ISIN,Ticker,Name,Notes,ID,No. of shares,Price / share,Currency (Price / share),Exchange rate,Currency (Result),Total,Currency (Total)
+# Sample Trading 212 CSV content with various transaction types; the
+# bytes form is encoded once here so file-writing fixtures skip the
+# per-test text-mode encode
+SAMPLE_CSV_CONTENT = """Action,Time,ISIN,Ticker,Name,Notes,ID,No. of shares,Price / share,Currency (Price / share),Exchange rate,Currency (Result),Total,Currency (Total)
 Market buy,2025-01-01 10:00:00.000,US5949181045,MSFT,Microsoft Corporation,,12345,10.5,150.00,USD,0.8,GBP,-1260.00,GBP
 Market sell,2025-01-02 11:00:00.000,US0378331005,AAPL,Apple Inc.,,12346,5.0,180.00,USD,0.85,GBP,765.00,GBP
 Deposit,2025-01-01 09:00:00.000,,,,,54321,,,,,GBP,1000.00,GBP
 Interest on cash,2025-01-15 12:00:00.000,,,,,54322,,,,,GBP,5.50,GBP
 Market buy,2025-01-03 14:00:00.000,GB00BH4HKS39,VOD,Vodafone Group Plc,,12347,100.0,0.75,GBP,1.0,GBP,-75.00,GBP
 """
+SAMPLE_CSV_BYTES = SAMPLE_CSV_CONTENT.encode("utf-8")
 
+# Invalid CSV content missing required headers
+INVALID_CSV_CONTENT = """Action,Time,ISIN
+Market buy,2025-01-01 10:00:00.000,US5949181045
+"""
 
-@pytest.fixture
-def temp_csv_file(sample_csv_content):
-    """Create a temporary CSV file with sample content."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-        f.write(sample_csv_content)
-        temp_path = Path(f.name)
 
-    yield temp_path
+@pytest.fixture(scope="session")
+def sample_csv_content():
+    """Sample Trading 212 CSV content with various transaction types."""
+    return SAMPLE_CSV_CONTENT
+
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture
+def csv_buffer(sample_csv_content):
+    """Sample CSV content as an in-memory stream."""
+    return io.StringIO(sample_csv_content)
 
 
 @pytest.fixture
+def temp_csv_file(tmp_path):
+    """CSV file with sample content, for the path-based API tests."""
+    path = tmp_path / "transactions.csv"
+    path.write_bytes(SAMPLE_CSV_BYTES)
+    return path
+
+
+@pytest.fixture(scope="session")
 def invalid_csv_content():
     """Invalid CSV content missing required headers."""
-    return """Action,Time,ISIN
-Market buy,2025-01-01 10:00:00.000,US5949181045
-"""
+    return INVALID_CSV_CONTENT
 
 
 @pytest.fixture
-def temp_invalid_csv_file(invalid_csv_content):
-    """Create a temporary invalid CSV file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-        f.write(invalid_csv_content)
-        temp_path = Path(f.name)
+def invalid_csv_buffer(invalid_csv_content):
+    """Invalid CSV content as an in-memory stream."""
+    return io.StringIO(invalid_csv_content)
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture(scope="module")
+def converted_splits(converter, sample_csv_content):
+    """Splits from converting the sample CSV, computed once per module."""
+    return converter.convert_to_list(io.StringIO(sample_csv_content))
 
 
 class TestTradingConverterInit:
     """Test Trading212Converter initialization."""
 
-    def test_init_with_config(self, sample_config):
-        """Test initialization with provided config."""
-        converter = Trading212Converter(sample_config)
-        assert converter.config == sample_config
-        assert converter.logger is not None
-
-    def test_init_without_config(self):
-        """Test initialization without config uses defaults."""
-        converter = Trading212Converter()
-        assert converter.config is not None
+    @pytest.mark.parametrize(
+        "init_style",
+        [
+            pytest.param("with-config", id="with-config"),
+            pytest.param("none-config", id="none-config"),
+            pytest.param("no-args", id="no-args"),
+        ],
+    )
+    def test_init(self, sample_config, init_style):
+        """Test initialization with, without and with a None config."""
+        if init_style == "with-config":
+            converter = Trading212Converter(sample_config)
+            assert converter.config == sample_config
+        elif init_style == "none-config":
+            converter = Trading212Converter(None)
+        else:
+            converter = Trading212Converter()
+
+        # None/omitted both fall back to a default Config
         assert isinstance(converter.config, Config)
         assert converter.logger is not None
 
-    def test_init_with_none_config(self):
-        """Test initialization with None config uses defaults."""
-        converter = Trading212Converter(None)
-        assert converter.config is not None
-        assert isinstance(converter.config, Config)
-
 
 class TestValidateCSVFile:
     """Test CSV file validation functionality."""
@@ -156,73 +228,55 @@ class TestValidateCSVFile:
         """Test validation of valid CSV file."""
         assert converter.validate_csv_file(temp_csv_file)
 
-    def test_validate_invalid_csv_file(self, converter, temp_invalid_csv_file):
-        """Test validation of invalid CSV file."""
-        assert not converter.validate_csv_file(temp_invalid_csv_file)
+    def test_validate_valid_csv_buffer(self, converter, csv_buffer):
+        """Test validation of an already-open file-like object."""
+        assert converter.validate_csv_file(csv_buffer)
+
+    def test_validate_invalid_csv_file(self, converter, invalid_csv_buffer):
+        """Test validation of invalid CSV content."""
+        assert not converter.validate_csv_file(invalid_csv_buffer)
 
     def test_validate_csv_with_string_path(self, converter, temp_csv_file):
         """Test validation with string path instead of Path object."""
         assert converter.validate_csv_file(str(temp_csv_file))
 
     def test_validate_empty_csv_file(self, converter):
-        """Test validation of empty CSV file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write("")
-            temp_path = Path(f.name)
-
-        try:
-            assert not converter.validate_csv_file(temp_path)
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        """Test validation of empty CSV content."""
+        assert not converter.validate_csv_file(io.StringIO(""))
 
     def test_validate_csv_missing_trading_headers(self, converter):
         """Test validation of CSV missing trading-specific headers."""
         csv_content = """Action,Time,ISIN,Ticker,Name,Notes,ID,Total,Currency (Total)
 Deposit,2025-01-01 09:00:00.000,,,,,54321,1000.00,GBP
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(csv_content)
-            temp_path = Path(f.name)
-
-        try:
-            # Should still be valid (trading headers are optional for non-trading transactions)
-            assert converter.validate_csv_file(temp_path)
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_validate_csv_file_encoding_error(self, converter):
-        """Test validation with file encoding issues."""
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".csv", delete=False) as f:
-            # Write invalid UTF-8 bytes
-            f.write(b"\xff\xfe\x00\x00")
-            temp_path = Path(f.name)
+        # Should still be valid (trading headers are optional for non-trading transactions)
+        assert converter.validate_csv_file(io.StringIO(csv_content))
 
-        try:
-            assert not converter.validate_csv_file(temp_path)
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+    def test_validate_csv_file_encoding_error(self, converter, tmp_path):
+        """Test validation with file encoding issues."""
+        # Write invalid UTF-8 bytes
+        bad_file = tmp_path / "bad.csv"
+        bad_file.write_bytes(b"\xff\xfe\x00\x00")
+        assert not converter.validate_csv_file(bad_file)
 
 
 class TestReadTransactions:
     """Test transaction reading functionality."""
 
-    def test_read_transactions_valid_file(self, converter, temp_csv_file):
-        """Test reading transactions from valid CSV file."""
-        transactions = list(converter.read_transactions(temp_csv_file))
-        assert len(transactions) == 5
+    def test_read_transactions_valid_buffer(self, converter, csv_buffer):
+        """Test reading transactions from valid CSV content."""
+        # Consume lazily rather than materializing the whole generator;
+        # the path-based test below keeps the full length check
+        transactions = converter.read_transactions(csv_buffer)
+        first_transaction, _, deposit_transaction = islice(transactions, 3)
 
         # Check first transaction (Market buy)
-        first_transaction = transactions[0]
         assert first_transaction.action == "Market buy"
         assert first_transaction.ticker == "MSFT"
         assert first_transaction.num_shares == Decimal("10.5")
         assert first_transaction.price_per_share == Decimal("150.00")
 
         # Check deposit transaction
-        deposit_transaction = transactions[2]
         assert deposit_transaction.action == "Deposit"
         assert deposit_transaction.ticker is None
         assert deposit_transaction.total == Decimal("1000.00")
@@ -237,20 +291,12 @@ class TestReadTransactions:
         csv_content = """Action,Time,ISIN,Ticker,Name,Notes,ID,No. of shares,Price / share,Currency (Price / share),Exchange rate,Currency (Result),Total,Currency (Total)
 Deposit,2025-01-01 09:00:00.000,,,,,54321,,,,,GBP,1000.00,GBP
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(csv_content)
-            temp_path = Path(f.name)
-
-        try:
-            transactions = list(converter.read_transactions(temp_path))
-            assert len(transactions) == 1
-            transaction = transactions[0]
-            assert transaction.action == "Deposit"
-            assert transaction.ticker is None
-            assert transaction.isin is None
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        transactions = list(converter.read_transactions(io.StringIO(csv_content)))
+        assert len(transactions) == 1
+        transaction = transactions[0]
+        assert transaction.action == "Deposit"
+        assert transaction.ticker is None
+        assert transaction.isin is None
 
     def test_read_transactions_invalid_row(self, converter):
         """Test reading transactions with invalid row data."""
@@ -258,130 +304,118 @@ Deposit,2025-01-01 09:00:00.000,,,,,54321,,,,,GBP,1000.00,GBP
 Invalid Action,invalid-date,,,,,54321,invalid-shares,invalid-price,,,,invalid-total,GBP
 Deposit,2025-01-01 09:00:00.000,,,,,54322,,,,,GBP,1000.00,GBP
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(csv_content)
-            temp_path = Path(f.name)
+        transactions = list(converter.read_transactions(io.StringIO(csv_content)))
+        # Should skip invalid row and return only valid one
+        assert len(transactions) == 1
+        assert transactions[0].action == "Deposit"
 
-        try:
-            transactions = list(converter.read_transactions(temp_path))
-            # Should skip invalid row and return only valid one
-            assert len(transactions) == 1
-            assert transactions[0].action == "Deposit"
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+    def test_read_transactions_missing_required_value(self, converter):
+        """Test that rows with an empty required column are skipped."""
+        csv_content = """Action,Time,ISIN,Ticker,Name,Notes,ID,No. of shares,Price / share,Currency (Price / share),Exchange rate,Currency (Result),Total,Currency (Total)
+Deposit,2025-01-01 09:00:00.000,,,,,54321,,,,,GBP,,GBP
+Market buy,2025-01-01 10:00:00.000,US5949181045,MSFT,Microsoft Corporation,,12345,10.5,150.00,USD,0.8,GBP,,GBP
+Deposit,2025-01-02 09:00:00.000,,,,,54322,,,,,GBP,1000.00,GBP
+"""
+        transactions = list(converter.read_transactions(io.StringIO(csv_content)))
+        # The two rows with an empty Total must not become zero-valued
+        # splits; only the complete deposit survives
+        assert len(transactions) == 1
+        assert transactions[0].id == "54322"
 
 
 class TestConvertTransaction:
     """Test individual transaction conversion."""
 
-    def test_convert_deposit_transaction(self, converter):
-        """Test converting a deposit transaction."""
-        transaction = Trading212Transaction(
-            action="Deposit",
-            time="2025-01-01 09:00:00.000",
-            id="54321",
-            total=Decimal("1000.00"),
-            total_currency="GBP",
-        )
-
+    @pytest.mark.parametrize(
+        ("transaction", "expected"),
+        [
+            pytest.param(
+                SAMPLE_TRANSACTIONS["deposit"],
+                {
+                    "account_attr": "deposit_account",
+                    "value": "1000.00",
+                    "description_contains": "Deposit from Trading 212",
+                },
+                id="deposit",
+            ),
+            pytest.param(
+                SAMPLE_TRANSACTIONS["interest"],
+                {
+                    "account_attr": "interest_account",
+                    "value": "5.50",
+                    "description_contains": "Interest on cash from Trading 212",
+                },
+                id="interest",
+            ),
+            pytest.param(
+                SAMPLE_TRANSACTIONS["market_buy"],
+                {
+                    # Mapped ticker; buy action gives a positive amount
+                    "commodity": "NASDAQ:MSFT",
+                    "amount": "10.500000",
+                    "memo_contains": "Purchase of 10.500000 shares",
+                },
+                id="market-buy",
+            ),
+            pytest.param(
+                SAMPLE_TRANSACTIONS["market_sell"],
+                {
+                    # Mapped ticker; sell action gives a negative amount
+                    "commodity": "NASDAQ:AAPL",
+                    "amount": "-5.000000",
+                    "memo_contains": "Sale of 5.000000 shares",
+                },
+                id="market-sell",
+            ),
+            pytest.param(
+                replace(SAMPLE_TRANSACTIONS["deposit"], id=""),
+                {
+                    "memo_contains": "Trading 212 deposit",
+                    "memo_excludes": "ID:",
+                },
+                id="deposit-no-id",
+            ),
+            pytest.param(
+                replace(SAMPLE_TRANSACTIONS["interest"], id=""),
+                {
+                    "memo_contains": "Trading 212 interest payment",
+                    "memo_excludes": "ID:",
+                },
+                id="interest-no-id",
+            ),
+        ],
+    )
+    def test_convert_single_split_transactions(self, converter, transaction, expected):
+        """Test conversions that produce exactly one clean split."""
         result = converter.convert_transaction(transaction)
         assert isinstance(result, ConversionResult)
         assert len(result.splits) == 1
         assert len(result.errors) == 0
 
         split = result.splits[0]
-        assert split.account == converter.config.deposit_account
-        assert split.value == "1000.00"
-        assert "Deposit from Trading 212" in split.description
+        if "account_attr" in expected:
+            assert split.account == getattr(converter.config, expected["account_attr"])
+        if "value" in expected:
+            assert split.value == expected["value"]
+        if "description_contains" in expected:
+            assert expected["description_contains"] in split.description
+        if "commodity" in expected:
+            assert split.transaction_commodity == expected["commodity"]
+        if "amount" in expected:
+            assert split.amount == expected["amount"]
+        if "memo_contains" in expected:
+            assert expected["memo_contains"] in split.memo
+        if "memo_excludes" in expected:
+            assert expected["memo_excludes"] not in split.memo
 
     def test_convert_deposit_with_notes(self, converter):
         """Test converting a deposit transaction with notes."""
-        transaction = Trading212Transaction(
-            action="Deposit",
-            time="2025-01-01 09:00:00.000",
-            id="54321",
-            total=Decimal("1000.00"),
-            total_currency="GBP",
-            notes="Bank transfer",
-        )
+        transaction = replace(SAMPLE_TRANSACTIONS["deposit"], notes="Bank transfer")
 
         result = converter.convert_transaction(transaction)
         split = result.splits[0]
         assert "Bank transfer" in split.description
 
-    def test_convert_interest_transaction(self, converter):
-        """Test converting an interest transaction."""
-        transaction = Trading212Transaction(
-            action="Interest on cash",
-            time="2025-01-15 12:00:00.000",
-            id="54322",
-            total=Decimal("5.50"),
-            total_currency="GBP",
-        )
-
-        result = converter.convert_transaction(transaction)
-        assert len(result.splits) == 1
-        assert len(result.errors) == 0
-
-        split = result.splits[0]
-        assert split.account == converter.config.interest_account
-        assert split.value == "5.50"
-        assert "Interest on cash from Trading 212" in split.description
-
-    def test_convert_market_buy_transaction(self, converter):
-        """Test converting a market buy transaction."""
-        transaction = Trading212Transaction(
-            action="Market buy",
-            time="2025-01-01 10:00:00.000",
-            isin="US5949181045",
-            ticker="MSFT",
-            name="Microsoft Corporation",
-            id="12345",
-            num_shares=Decimal("10.5"),
-            price_per_share=Decimal("150.00"),
-            price_currency="USD",
-            exchange_rate=Decimal("0.8"),
-            result_currency="GBP",
-            total=Decimal("-1260.00"),
-            total_currency="GBP",
-        )
-
-        result = converter.convert_transaction(transaction)
-        assert len(result.splits) == 1
-        assert len(result.errors) == 0
-
-        split = result.splits[0]
-        assert split.transaction_commodity == "NASDAQ:MSFT"  # Mapped ticker
-        assert split.amount == "10.500000"  # Buy action, positive amount
-        assert "Purchase of 10.500000 shares" in split.memo
-
-    def test_convert_market_sell_transaction(self, converter):
-        """Test converting a market sell transaction."""
-        transaction = Trading212Transaction(
-            action="Market sell",
-            time="2025-01-02 11:00:00.000",
-            isin="US0378331005",
-            ticker="AAPL",
-            name="Apple Inc.",
-            id="12346",
-            num_shares=Decimal("5.0"),
-            price_per_share=Decimal("180.00"),
-            price_currency="USD",
-            exchange_rate=Decimal("0.85"),
-            result_currency="GBP",
-            total=Decimal("765.00"),
-            total_currency="GBP",
-        )
-
-        result = converter.convert_transaction(transaction)
-        assert len(result.splits) == 1
-
-        split = result.splits[0]
-        assert split.transaction_commodity == "NASDAQ:AAPL"  # Mapped ticker
-        assert split.amount == "-5.000000"  # Sell action, negative amount
-        assert "Sale of 5.000000 shares" in split.memo
-
     def test_convert_trading_transaction_missing_data(self, converter):
         """Test converting trading transaction with missing required data."""
         transaction = Trading212Transaction(
@@ -401,16 +435,8 @@ class TestConvertTransaction:
 
     def test_convert_unsupported_action(self, converter):
         """Test converting transaction with unsupported action type."""
-        # Create a transaction with a supported action and then modify it
-        transaction = Trading212Transaction(
-            action="Deposit",
-            time="2025-01-01 10:00:00.000",
-            id="12345",
-            total=Decimal("100.00"),
-            total_currency="GBP",
-        )
-        # Manually change the action to something unsupported after validation
-        transaction.action = "Unknown Action"
+        # replace() copies, so the shared sample stays untouched
+        transaction = replace(SAMPLE_TRANSACTIONS["deposit"], action="Unknown Action")
 
         result = converter.convert_transaction(transaction)
         assert len(result.splits) == 0
@@ -456,36 +482,6 @@ class TestConvertTransaction:
 class TestPrivateConversionMethods:
     """Test private conversion methods."""
 
-    def test_convert_deposit_no_id(self, converter):
-        """Test deposit conversion without ID."""
-        transaction = Trading212Transaction(
-            action="Deposit",
-            time="2025-01-01 09:00:00.000",
-            id="",  # Empty ID
-            total=Decimal("1000.00"),
-            total_currency="GBP",
-        )
-
-        result = converter._convert_deposit(transaction)
-        split = result.splits[0]
-        assert "Trading 212 deposit" in split.memo
-        assert "ID:" not in split.memo
-
-    def test_convert_interest_no_id(self, converter):
-        """Test interest conversion without ID."""
-        transaction = Trading212Transaction(
-            action="Interest on cash",
-            time="2025-01-15 12:00:00.000",
-            id="",  # Empty ID
-            total=Decimal("5.50"),
-            total_currency="GBP",
-        )
-
-        result = converter._convert_interest(transaction)
-        split = result.splits[0]
-        assert "Trading 212 interest payment" in split.memo
-        assert "ID:" not in split.memo
-
     def test_calculate_gbp_price_with_exchange_rate(self, converter):
         """Test GBP price calculation using exchange rate."""
         transaction = Trading212Transaction(
@@ -586,28 +582,21 @@ class TestPrivateConversionMethods:
 class TestConvertFile:
     """Test full file conversion functionality."""
 
-    def test_convert_file_success(self, converter, temp_csv_file):
+    def test_convert_file_success(
+        self, converter, csv_buffer, converted_splits, tmp_path
+    ):
         """Test successful file conversion."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            result = converter.convert_file(temp_csv_file, output_path)
-            assert result is True
-            assert output_path.exists()
-
-            # Check output file content
-            with open(output_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-            # Should have splits for all transactions
-            assert len(rows) > 0
-
-            # Check headers
-            expected_headers = [
+        output_path = tmp_path / "output.csv"
+        result = converter.convert_file(csv_buffer, output_path)
+        assert result is True
+        assert output_path.exists()
+
+        # Check header plus the first data row against the shared
+        # in-memory conversion; full content is covered by
+        # test_convert_to_list
+        with open(output_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            assert next(reader) == [
                 "Date",
                 "Number",
                 "Description",
@@ -617,90 +606,61 @@ class TestConvertFile:
                 "Amount",
                 "Value",
             ]
-            assert reader.fieldnames == expected_headers
-
-        finally:
-            if output_path.exists():
-                output_path.unlink()
-
-    def test_convert_file_invalid_input(self, converter, temp_invalid_csv_file):
-        """Test file conversion with invalid input file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            result = converter.convert_file(temp_invalid_csv_file, output_path)
-            assert result is False
-        finally:
-            if output_path.exists():
-                output_path.unlink()
-
-    def test_convert_file_with_string_paths(self, converter, temp_csv_file):
+            assert tuple(next(reader)) == converted_splits[0].as_row()
+
+    def test_convert_to_list(self, converter, converted_splits):
+        """Test in-memory conversion returns the splits convert_file writes."""
+        # One split per sample transaction
+        assert len(converted_splits) == 5
+
+        first = converted_splits[0]
+        assert first.transaction_commodity == "NASDAQ:MSFT"
+        assert first.amount == "10.500000"
+
+        deposit = converted_splits[2]
+        assert deposit.account == converter.config.deposit_account
+        assert deposit.value == "1000.00"
+
+    def test_convert_file_invalid_input(self, converter, invalid_csv_buffer, tmp_path):
+        """Test file conversion with invalid input."""
+        output_path = tmp_path / "output.csv"
+        result = converter.convert_file(invalid_csv_buffer, output_path)
+        assert result is False
+        # A failed conversion must not leave a header-only stub behind
+        assert not output_path.exists()
+
+    def test_convert_file_with_string_paths(self, converter, temp_csv_file, tmp_path):
         """Test file conversion with string paths."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            result = converter.convert_file(str(temp_csv_file), str(output_path))
-            assert result is True
-            assert output_path.exists()
-        finally:
-            if output_path.exists():
-                output_path.unlink()
-
-    def test_convert_file_write_error(self, converter, temp_csv_file):
+        output_path = tmp_path / "output.csv"
+        result = converter.convert_file(str(temp_csv_file), str(output_path))
+        assert result is True
+        assert output_path.exists()
+
+    def test_convert_file_write_error(self, converter, csv_buffer):
         """Test file conversion with write error."""
         # Try to write to a directory that doesn't exist
         invalid_output = Path("/nonexistent/directory/output.csv")
 
-        result = converter.convert_file(temp_csv_file, invalid_output)
+        result = converter.convert_file(csv_buffer, invalid_output)
         assert result is False
 
-    def test_convert_file_with_errors_and_warnings(self, converter):
-        """Test file conversion with transactions that generate errors and warnings."""
+    def test_convert_with_errors_and_warnings(self, converter):
+        """Test conversion with transactions that generate errors and warnings."""
         csv_content = """Action,Time,ISIN,Ticker,Name,Notes,ID,No. of shares,Price / share,Currency (Price / share),Exchange rate,Currency (Result),Total,Currency (Total)
 Market buy,2025-01-01 10:00:00.000,US5949181045,MSFT,Microsoft Corporation,,12345,10.5,150.00,USD,0.8,GBP,-1260.00,GBP
 Market buy,2025-01-02 11:00:00.000,,,,,12346,,,,,,,-1000.00,GBP
 Unsupported Action,2025-01-03 12:00:00.000,,,,,12347,,,,,GBP,100.00,GBP
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as input_file:
-            input_file.write(csv_content)
-            input_path = Path(input_file.name)
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            result = converter.convert_file(input_path, output_path)
-            assert result is True  # Should still succeed despite errors
-
-            # Check that valid transactions were processed
-            with open(output_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-            # Should have at least one valid transaction
-            assert len(rows) >= 1
-
-        finally:
-            if input_path.exists():
-                input_path.unlink()
-            if output_path.exists():
-                output_path.unlink()
+        # Erroring transactions are skipped rather than aborting the run
+        splits = converter.convert_to_list(io.StringIO(csv_content))
+        assert len(splits) == 1
+        assert splits[0].transaction_commodity == "NASDAQ:MSFT"
 
 
 class TestConverterIntegration:
     """Integration tests for the converter."""
 
-    def test_end_to_end_conversion(self, sample_config):
+    def test_end_to_end_conversion(self, sample_config, tmp_path):
         """Test complete end-to-end conversion process."""
         converter = Trading212Converter(sample_config)
 
@@ -711,50 +671,36 @@ Market buy,2025-01-01 10:00:00.000,US5949181045,MSFT,Microsoft Corporation,,B001
 Interest on cash,2025-01-15 12:00:00.000,,,,,I001,,,,,GBP,12.50,GBP
 Market sell,2025-01-20 14:00:00.000,US5949181045,MSFT,Microsoft Corporation,,S001,5.0,160.00,USD,0.75,GBP,600.00,GBP
 """
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as input_file:
-            input_file.write(csv_content)
-            input_path = Path(input_file.name)
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            # Validate and convert
-            assert converter.validate_csv_file(input_path)
-            assert converter.convert_file(input_path, output_path)
-
-            # Verify output
-            with open(output_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-            # Should have 4 splits (one for each transaction)
-            assert len(rows) == 4
-
-            # Verify specific transactions
-            deposit_split = rows[0]
-            assert deposit_split["Account"] == sample_config.deposit_account
-            assert deposit_split["Value"] == "2000.00"
-
-            buy_split = rows[1]
-            assert buy_split["Transaction Commodity"] == "NASDAQ:MSFT"
-            assert buy_split["Amount"] == "10.000000"
-
-            interest_split = rows[2]
-            assert interest_split["Account"] == sample_config.interest_account
-            assert interest_split["Value"] == "12.50"
-
-            sell_split = rows[3]
-            assert sell_split["Transaction Commodity"] == "NASDAQ:MSFT"
-            assert sell_split["Amount"] == "-5.000000"
-
-        finally:
-            if input_path.exists():
-                input_path.unlink()
-            if output_path.exists():
-                output_path.unlink()
+        input_path = tmp_path / "input.csv"
+        input_path.write_text(csv_content, encoding="utf-8")
+        output_path = tmp_path / "output.csv"
+
+        # Validate and convert
+        assert converter.validate_csv_file(input_path)
+        assert converter.convert_file(input_path, output_path)
+
+        # Verify output
+        with open(output_path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+
+        # Should have 4 splits (one for each transaction)
+        assert reader.fieldnames is not None
+        assert len(rows) == 4
+
+        # Verify specific transactions
+        deposit_split = rows[0]
+        assert deposit_split["Account"] == sample_config.deposit_account
+        assert deposit_split["Value"] == "2000.00"
+
+        buy_split = rows[1]
+        assert buy_split["Transaction Commodity"] == "NASDAQ:MSFT"
+        assert buy_split["Amount"] == "10.000000"
+
+        interest_split = rows[2]
+        assert interest_split["Account"] == sample_config.interest_account
+        assert interest_split["Value"] == "12.50"
+
+        sell_split = rows[3]
+        assert sell_split["Transaction Commodity"] == "NASDAQ:MSFT"
+        assert sell_split["Amount"] == "-5.000000"